@@ -15,6 +15,11 @@ from TTS.utils.audio.numpy_transforms import compute_energy as calculate_energy
 
 import mutagen
 
+try:
+    import lmdb
+except ImportError:
+    lmdb = None
+
 # to prevent too many open files error as suggested here
 # https://github.com/pytorch/pytorch/issues/11201#issuecomment-421146936
 torch.multiprocessing.set_sharing_strategy("file_system")
@@ -574,6 +579,20 @@ class TTSDataset(Dataset):
         )
 
 
+_LMDB_ENVS = {}
+
+
+def _open_lmdb(path):
+    """Open an LMDB environment once per process"""
+    key = (os.getpid(), path)
+    if key not in _LMDB_ENVS:
+        # an environment inherited through fork() (e.g. by a DataLoader worker) must not be used, only closed
+        for stale_key in [k for k in _LMDB_ENVS if k[1] == path]:
+            _LMDB_ENVS.pop(stale_key).close()
+        _LMDB_ENVS[key] = lmdb.open(path, map_size=1 << 34, readahead=False)
+    return _LMDB_ENVS[key]
+
+
 class PhonemeDataset(Dataset):
     """Phoneme Dataset for converting input text to phonemes and then token IDs
 
@@ -589,6 +608,8 @@ class PhonemeDataset(Dataset):
 
         cache_path (str):
             Path to cache phonemes. If `cache_path` is already present or None, it skips the pre-computation.
+            A path ending in `.lmdb` keeps the whole cache in one LMDB database instead of a file per sample,
+            which avoids a file lookup per sample on slow or networked file systems (needs `lmdb`).
 
         precompute_num_workers (int):
             Number of workers used for pre-computing the phonemes. Defaults to 0.
@@ -604,6 +625,9 @@ class PhonemeDataset(Dataset):
         self.samples = samples
         self.tokenizer = tokenizer
         self.cache_path = cache_path
+        self.use_lmdb = cache_path is not None and cache_path.endswith(".lmdb")
+        if self.use_lmdb and lmdb is None:
+            raise ImportError(" [!] An `.lmdb` phoneme cache needs the `lmdb` package: `pip install lmdb`.")
         if cache_path is not None and not os.path.exists(cache_path):
             os.makedirs(cache_path)
             self.precompute(precompute_num_workers)
@@ -622,6 +646,8 @@ class PhonemeDataset(Dataset):
 
         If the phonemes are already cached, load them from cache.
         """
+        if self.use_lmdb:
+            return self._compute_or_load_lmdb(file_name, text, language)
         file_ext = "_phoneme.npy"
         cache_path = os.path.join(self.cache_path, file_name + file_ext)
         try:
@@ -631,6 +657,18 @@ class PhonemeDataset(Dataset):
             np.save(cache_path, ids)
         return ids
 
+    def _compute_or_load_lmdb(self, file_name, text, language):
+        env = _open_lmdb(self.cache_path)
+        key = file_name.encode("utf-8")
+        with env.begin() as txn:
+            value = txn.get(key)
+        if value is not None:
+            return np.frombuffer(value, dtype=np.int32)
+        ids = np.asarray(self.tokenizer.text_to_ids(text, language=language), dtype=np.int32)
+        with env.begin(write=True) as txn:
+            txn.put(key, ids.tobytes())
+        return ids
+
     def get_pad_id(self):
         """Get pad token ID for sequence padding"""
         return self.tokenizer.pad_id
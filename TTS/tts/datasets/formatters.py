@@ -8,6 +8,14 @@ from typing import List
 import pandas as pd
 from tqdm import tqdm
 
+try:
+    import pyarrow  # pylint: disable=unused-import
+
+    # pandas parses with Arrow's multithreaded C++ reader when it is installed
+    _CSV_ENGINE = "pyarrow"
+except ImportError:
+    _CSV_ENGINE = "c"
+
 ########################
 # DATASETS
 ########################
@@ -52,37 +60,49 @@ def cml_tts(root_path, meta_file, ignored_speakers=None):
     return items
 
 
-def coqui(root_path, meta_file, ignored_speakers=None):
-    """Interal dataset formatter."""
-    filepath = os.path.join(root_path, meta_file)
+def read_coqui_rows(filepath):
+    """Parse a coqui metadata CSV into its columns, `{column name: [values]}`."""
     # ensure there are 4 columns for every line
     with open(filepath, "r", encoding="utf8") as f:
         lines = f.readlines()
     num_cols = len(lines[0].split("|"))  # take the first row as reference
+    engine = _CSV_ENGINE
     for idx, line in enumerate(lines[1:]):
         if len(line.split("|")) != num_cols:
             print(f" > Missing column in line {idx + 1} -> {line.strip()}")
+            # pyarrow raises on rows with missing fields, the C parser fills them with NaN
+            engine = "c"
     # load metadata
-    metadata = pd.read_csv(os.path.join(root_path, meta_file), sep="|")
+    try:
+        metadata = pd.read_csv(filepath, sep="|", engine=engine)
+    except ValueError:  # pyarrow's ArrowInvalid and pandas' ParserError both derive from it
+        if engine == "c":
+            raise
+        metadata = pd.read_csv(filepath, sep="|", engine="c")
     assert all(x in metadata.columns for x in ["audio_file", "text"])
-    speaker_name = None if "speaker_name" in metadata.columns else "coqui"
-    emotion_name = None if "emotion_name" in metadata.columns else "neutral"
+    return {column: metadata[column].tolist() for column in metadata.columns}
+
+
+def coqui_items_from_rows(rows, root_path, ignored_speakers=None):
+    """Build samples from the columns returned by `read_coqui_rows`, skipping missing audio files."""
+    speaker_name = None if "speaker_name" in rows else "coqui"
+    emotion_name = None if "emotion_name" in rows else "neutral"
     items = []
     not_found_counter = 0
-    for row in metadata.itertuples():
-        if speaker_name is None and ignored_speakers is not None and row.speaker_name in ignored_speakers:
+    for i, audio_file in enumerate(rows["audio_file"]):
+        if speaker_name is None and ignored_speakers is not None and rows["speaker_name"][i] in ignored_speakers:
             continue
-        audio_path = os.path.join(root_path, row.audio_file)
+        audio_path = os.path.join(root_path, audio_file)
         if not os.path.exists(audio_path):
             not_found_counter += 1
             continue
         items.append(
             {
-                "text": row.text,
+                "text": rows["text"][i],
                 "audio_file": audio_path,
-                "ref_file": "null" if "ref_file" not in metadata.columns else os.path.join(root_path, row.ref_file),
-                "speaker_name": speaker_name if speaker_name is not None else row.speaker_name,
-                "emotion_name": emotion_name if emotion_name is not None else row.emotion_name,
+                "ref_file": "null" if "ref_file" not in rows else os.path.join(root_path, rows["ref_file"][i]),
+                "speaker_name": speaker_name if speaker_name is not None else rows["speaker_name"][i],
+                "emotion_name": emotion_name if emotion_name is not None else rows["emotion_name"][i],
                 "root_path": root_path,
             }
         )
@@ -91,6 +111,12 @@ def coqui(root_path, meta_file, ignored_speakers=None):
     return items
 
 
+def coqui(root_path, meta_file, ignored_speakers=None):
+    """Interal dataset formatter."""
+    rows = read_coqui_rows(os.path.join(root_path, meta_file))
+    return coqui_items_from_rows(rows, root_path, ignored_speakers=ignored_speakers)
+
+
 def tweb(root_path, meta_file, **kwargs):  # pylint: disable=unused-argument
     """Normalize TWEB dataset.
     https://www.kaggle.com/bryanpark/the-world-english-bible-speech-dataset
@@ -10,6 +10,9 @@ from TTS.tts.models.xtts import load_audio
 
 torch.set_num_threads(1)
 
+# how many replacement samples a length-sampled item may try before giving up
+MAX_LOAD_RETRIES = 32
+
 
 def key_samples_by_col(samples, col):
     """Returns a dictionary of samples keyed by language."""
@@ -74,6 +77,8 @@ class XTTSDataset(torch.utils.data.Dataset):
         self.max_wav_len = model_args.max_wav_length
         self.max_text_len = model_args.max_text_length
         self.use_masking_gt_prompt_approach = model_args.gpt_use_masking_gt_prompt_approach
+        # a length sampler chooses the samples itself, so indices must map to fixed samples
+        self.use_length_sampler = getattr(config, "use_length_sampler", False) and not is_eval
         assert self.max_wav_len is not None and self.max_text_len is not None
 
         self.samples = samples
@@ -84,6 +89,7 @@ class XTTSDataset(torch.utils.data.Dataset):
             # order by language
             self.samples = key_samples_by_col(self.samples, "language")
             print(" > Sampling by language:", self.samples.keys())
+            self.indexed_samples = [sample for samples in self.samples.values() for sample in samples]
         else:
             # for evaluation load and check samples that are corrupted to ensures the reproducibility
             self.check_eval_samples()
@@ -107,8 +113,9 @@ class XTTSDataset(torch.utils.data.Dataset):
         self.samples = new_samples
         print(" > Total eval samples after filtering:", len(self.samples))
 
-    def get_text(self, text, lang):
-        tokens = self.tokenizer.encode(text, lang)
+    def get_text(self, text, lang, tokens=None):
+        if tokens is None:
+            tokens = self.tokenizer.encode(text, lang)
         tokens = torch.IntTensor(tokens)
         assert not torch.any(tokens == 1), f"UNK token found in {text} -> {self.tokenizer.decode(tokens)}"
         # The stop token should always be sacred.
@@ -117,7 +124,8 @@ class XTTSDataset(torch.utils.data.Dataset):
 
     def load_item(self, sample):
         text = str(sample["text"])
-        tseq = self.get_text(text, sample["language"])
+        # samples may carry token ids computed up front (see `text_tokens` in train_gpt_xtts.py)
+        tseq = self.get_text(text, sample["language"], sample.get("text_tokens"))
         audiopath = sample["audio_file"]
         wav = load_audio(audiopath, self.sample_rate)
         if text is None or len(text.strip()) == 0:
@@ -147,10 +155,23 @@ class XTTSDataset(torch.utils.data.Dataset):
 
         return tseq, audiopath, wav, cond, cond_len, cond_idxs
 
-    def __getitem__(self, index):
+    def retry_item(self, retries):
+        """Load a replacement for a sample that failed to load or is out of bounds"""
+        if not self.use_length_sampler:
+            # eval reads a fixed item; random sampling ignores the index anyway
+            return self[1]
+        if retries >= MAX_LOAD_RETRIES:
+            raise RuntimeError(f" [!] No loadable sample found after {MAX_LOAD_RETRIES} retries.")
+        # a fixed fallback index would replace every dropped clip with the same one
+        return self.__getitem__(random.randrange(len(self.indexed_samples)), retries + 1)
+
+    def __getitem__(self, index, retries=0):
         if self.is_eval:
             sample = self.samples[index]
             sample_id = str(index)
+        elif self.use_length_sampler:
+            sample = self.indexed_samples[index]
+            sample_id = str(index)
         else:
             # select a random language
             lang = random.choice(list(self.samples.keys()))
@@ -165,7 +186,7 @@ class XTTSDataset(torch.utils.data.Dataset):
             if self.debug_failures:
                 print(f"Ignoring sample {sample['audio_file']} because it was already ignored before !!")
             # call get item again to get other sample
-            return self[1]
+            return self.retry_item(retries)
 
         # try to load the sample, if fails added it to the failed samples list
         try:
@@ -174,7 +195,7 @@ class XTTSDataset(torch.utils.data.Dataset):
             if self.debug_failures:
                 print(f"error loading {sample['audio_file']} {sys.exc_info()}")
             self.failed_samples.add(sample_id)
-            return self[1]
+            return self.retry_item(retries)
 
         # check if the audio and text size limits and if it out of the limits, added it failed_samples
         if (
@@ -189,7 +210,7 @@ class XTTSDataset(torch.utils.data.Dataset):
                     f"error loading {sample['audio_file']}: ranges are out of bounds; {wav.shape[-1]}, {tseq.shape[0]}"
                 )
             self.failed_samples.add(sample_id)
-            return self[1]
+            return self.retry_item(retries)
 
         res = {
             # 'real_text': text,
@@ -1,3 +1,4 @@
+import os
 from dataclasses import dataclass, field
 from typing import Dict, List, Tuple, Union
 
@@ -6,7 +7,7 @@ import torch.nn as nn
 import torchaudio
 from coqpit import Coqpit
 from torch.nn import functional as F
-from torch.utils.data import DataLoader
+from torch.utils.data import DataLoader, RandomSampler
 from trainer.torch import DistributedSampler
 from trainer.trainer_utils import get_optimizer, get_scheduler
 
@@ -19,6 +20,18 @@ from TTS.tts.layers.xtts.trainer.dataset import XTTSDataset
 from TTS.tts.models.base_tts import BaseTTS
 from TTS.tts.models.xtts import Xtts, XttsArgs, XttsAudioConfig
 from TTS.utils.io import load_fsspec
+from TTS.utils.samplers import BucketBatchSampler
+
+
+def _get_optimizer(optimizer_name: str, optimizer_params: dict, lr: float, parameters) -> torch.optim.Optimizer:
+    """`trainer_utils.get_optimizer` that also knows bitsandbytes' `AdamW8bit` (8-bit optimizer state)"""
+    if optimizer_name.lower() == "adamw8bit":
+        try:
+            import bitsandbytes as bnb
+        except ImportError as e:
+            raise ImportError(" [!] The `AdamW8bit` optimizer needs `bitsandbytes`: `pip install bitsandbytes`.") from e
+        return bnb.optim.AdamW8bit(parameters, lr=lr, **optimizer_params)
+    return get_optimizer(optimizer_name, optimizer_params, lr, parameters=parameters)
 
 
 @dataclass
@@ -29,6 +42,10 @@ class GPTTrainerConfig(XttsConfig):
     weighted_loss_attrs: dict = field(default_factory=lambda: {})
     weighted_loss_multipliers: dict = field(default_factory=lambda: {})
     test_sentences: List[dict] = field(default_factory=lambda: [])
+    pin_memory: bool = True
+    persistent_workers: bool = True
+    prefetch_factor: int = 4
+    use_length_sampler: bool = False
 
 
 @dataclass
@@ -377,16 +394,42 @@ class GPTTrainer(BaseTTS):
             # get samplers
             sampler = self.get_sampler(dataset, num_gpus)
 
+            # keep the workers alive across epochs; torch rejects these options without worker processes
+            num_workers = config.num_eval_loader_workers if is_eval else config.num_loader_workers
+            worker_kwargs = {}
+            if num_workers > 0:
+                worker_kwargs = {
+                    "persistent_workers": config.persistent_workers,
+                    "prefetch_factor": config.prefetch_factor,
+                }
+
             # ignore sampler when is eval because if we changed the sampler parameter we will not be able to compare previous runs
-            if sampler is None or is_eval:
+            if config.use_length_sampler and not is_eval:
+                # batch clips of similar size together so little of each batch is padding; the file size
+                # stands in for the duration, as in Vits.get_sampler, and is read once per run
+                loader = DataLoader(
+                    dataset,
+                    batch_sampler=BucketBatchSampler(
+                        sampler if sampler is not None else RandomSampler(dataset),
+                        data=[os.path.getsize(sample["audio_file"]) for sample in dataset.indexed_samples],
+                        batch_size=config.batch_size,
+                        drop_last=False,
+                    ),
+                    collate_fn=dataset.collate_fn,
+                    num_workers=num_workers,
+                    pin_memory=config.pin_memory,
+                    **worker_kwargs,
+                )
+            elif sampler is None or is_eval:
                 loader = DataLoader(
                     dataset,
                     batch_size=config.eval_batch_size if is_eval else config.batch_size,
                     shuffle=False,
                     drop_last=False,
                     collate_fn=dataset.collate_fn,
-                    num_workers=config.num_eval_loader_workers if is_eval else config.num_loader_workers,
-                    pin_memory=False,
+                    num_workers=num_workers,
+                    pin_memory=config.pin_memory,
+                    **worker_kwargs,
                 )
             else:
                 loader = DataLoader(
@@ -394,8 +437,9 @@ class GPTTrainer(BaseTTS):
                     sampler=sampler,
                     batch_size = config.eval_batch_size if is_eval else config.batch_size,
                     collate_fn=dataset.collate_fn,
-                    num_workers=config.num_eval_loader_workers if is_eval else config.num_loader_workers,
-                    pin_memory=False,
+                    num_workers=num_workers,
+                    pin_memory=config.pin_memory,
+                    **worker_kwargs,
                 )
         return loader
 
@@ -446,7 +490,7 @@ class GPTTrainer(BaseTTS):
                 {"params": params_notweights, "weight_decay": 0},
             ]
             # torch.optim.AdamW
-            opt = get_optimizer(
+            opt = _get_optimizer(
                 self.config.optimizer,
                 self.config.optimizer_params,
                 self.config.lr,
@@ -455,7 +499,7 @@ class GPTTrainer(BaseTTS):
             opt._group_names = [params_names_weights, params_names_notweights]
             return opt
 
-        return get_optimizer(
+        return _get_optimizer(
             self.config.optimizer,
             self.config.optimizer_params,
             self.config.lr,
@@ -31,6 +31,9 @@ class BasePhonemizer(abc.ABC):
             Whether to preserve punctuation marks or not.
     """
 
+    # Subclasses that declare their own `__slots__` get instances without a `__dict__`
+    __slots__ = ("_language", "_keep_puncs", "_punctuator")
+
     def __init__(self, language, punctuations=Punctuation.default_puncs(), keep_puncs=False):
         # ensure the backend is installed on the system
         if not self.is_available():
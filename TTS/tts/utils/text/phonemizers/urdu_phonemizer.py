@@ -1,10 +1,59 @@
 # File: /TTS/tts/utils/text/phonemizers/urdu_phonemizer.py
-from typing import Dict
-from TTS.tts.utils.text.urdu.phonemizer import urdu_text_to_phonemes, normalize_urdu_text, add_custom_phoneme
+import functools
+import logging
+from typing import Dict, List
 from TTS.tts.utils.text.phonemizers.base import BasePhonemizer
 
+logger = logging.getLogger(__name__)
+
 _DEF_UR_PUNCS = "۔؍،؞؎؏؋٭٪٬٫"  # Urdu punctuation marks
 
+_BACKEND = None
+
+
+def _get_backend():
+    """Import the Urdu G2P backend on first use
+
+    Pipelines that build phonemizers for every language but never phonemize Urdu do not
+    pay for the backend import.
+    """
+    global _BACKEND
+    if _BACKEND is None:
+        from TTS.tts.utils.text.urdu import phonemizer as backend
+
+        # cached utterances may contain pronunciations the dictionary no longer has
+        backend.on_custom_dict_change(_cached_phonemize.cache_clear)
+        _BACKEND = backend
+    return _BACKEND
+
+
+@functools.lru_cache(maxsize=100_000)
+def _cached_phonemize(text: str, separator: str, use_espeak: bool) -> str:
+    """Phonemize an utterance, memoized on the raw text
+
+    Training iterates over the same utterances every epoch, so repeated calls are served
+    from the cache without re-running normalization, dictionary lookup and espeak.
+    The backend clears the cache whenever the custom dictionary changes.
+    """
+    backend = _get_backend()
+    # Normalize text first
+    text = backend.normalize_urdu_text(text)
+    
+    # Get phonemes using AUTOMATIC three-tier system
+    logger.debug("Processing: %.50s...", text)
+    phonemes = backend.urdu_text_to_phonemes(text, use_espeak=use_espeak)
+    logger.debug("Result: %.50s...", phonemes)
+    return _apply_separator(phonemes, separator)
+
+
+def _apply_separator(phonemes: str, separator: str) -> str:
+    """Place `separator` between phonemes, if one is specified"""
+    if separator:
+        # join() iterates the string directly, no intermediate character list
+        return separator.join(phonemes.replace(' ', f' {separator} '))
+    return phonemes
+
+
 class UrduPhonemizer(BasePhonemizer):
     """🐸TTS Urdu phonemizer with AUTOMATIC three-tier fallback system
     
@@ -20,7 +69,10 @@ class UrduPhonemizer(BasePhonemizer):
         'ɑ|s|ː|ɑ|l|ɑ|ː|m| |ɑ|l|ɑ|ɪ|k|u|m'
     """
     
+    __slots__ = ("use_espeak",)
+    
     language = "ur"
+    _SUPPORTED_LANGUAGES = frozenset({"ur", "urdu"})
     
     def __init__(self, punctuations=_DEF_UR_PUNCS, keep_puncs=True, use_espeak=True, **kwargs):
         """
@@ -31,10 +83,10 @@ class UrduPhonemizer(BasePhonemizer):
         """
         super().__init__(self.language, punctuations=punctuations, keep_puncs=keep_puncs)
         self.use_espeak = use_espeak
-        print(f"🚀 UrduPhonemizer initialized with automatic three-tier system")
-        print(f"   Tier 1: CUSTOM_DICTIONARY (always enabled)")
-        print(f"   Tier 2: ESPEAK-NG ({'enabled' if use_espeak else 'disabled'})")
-        print(f"   Tier 3: RULE_BASED (always enabled as final fallback)")
+        logger.debug(
+            "UrduPhonemizer initialized: custom dictionary, espeak-ng (%s), rule-based fallback",
+            "enabled" if use_espeak else "disabled",
+        )
     
     @staticmethod
     def name():
@@ -42,30 +94,46 @@ class UrduPhonemizer(BasePhonemizer):
     
     def add_word_phoneme(self, word: str, phoneme: str):
         """Add a custom word-phoneme mapping to the built-in dictionary"""
-        add_custom_phoneme(word, phoneme)
+        _get_backend().add_custom_phoneme(word, phoneme)
+    
+    def add_word_phonemes(self, mapping: Dict[str, str]):
+        """Add many word-phoneme mappings to the built-in dictionary at once"""
+        _get_backend().add_custom_phonemes(mapping)
+        logger.info("Added %d custom phonemes", len(mapping))
     
     def _phonemize(self, text: str, separator: str = "|") -> str:
         """Convert Urdu text to IPA phonemes using automatic three-tier system"""
-        # Normalize text first
-        text = normalize_urdu_text(text)
-        
-        # Get phonemes using AUTOMATIC three-tier system
-        print(f"🔄 Processing: {text[:50]}...")
-        phonemes = urdu_text_to_phonemes(text, use_espeak=self.use_espeak)
-        print(f"✅ Result: {phonemes[:50]}...")
-        
-        # Apply separator if specified
-        if separator and separator != "":
-            # Split phonemes and join with separator
-            phoneme_chars = list(phonemes.replace(' ', f' {separator} '))
-            return separator.join(phoneme_chars)
-        
-        return phonemes
+        return _cached_phonemize(text, separator, self.use_espeak)
     
     def phonemize(self, text: str, separator: str = "|", language=None) -> str:
         """Public phonemization method - AUTOMATIC processing"""
         return self._phonemize(text, separator)
     
+    def phonemize_batch(self, texts: List[str], separator: str = "|") -> List[str]:
+        """Phonemize a list of utterances in one call
+        
+        espeak runs in-process, so the whole batch is served without spawning a process per
+        utterance, and repeated utterances are answered from the phoneme cache.
+        """
+        return [self._phonemize(text, separator) for text in texts]
+    
+    def phonemize_parallel(self, texts: List[str], separator: str = "|", n_workers: int = None) -> List[str]:
+        """Phonemize a list of utterances on the backend's pool of worker processes
+        
+        A thin wrapper over `batch_phonemize`: texts are normalized and separators applied
+        here, while phonemization runs in the backend's workers, which sidesteps the GIL
+        for large dataset preprocessing runs.
+        
+        Args:
+            texts: Utterances to phonemize
+            separator: Separator placed between phonemes
+            n_workers: Number of worker processes. Defaults to the number of CPUs.
+        """
+        backend = _get_backend()
+        normalized = [backend.normalize_urdu_text(text) for text in texts]
+        phonemes = backend.batch_phonemize(normalized, workers=n_workers, use_espeak=self.use_espeak)
+        return [_apply_separator(p, separator) for p in phonemes]
+    
     @staticmethod
     def supported_languages() -> Dict:
         return {"ur": "urdu"}
@@ -80,7 +148,7 @@ class UrduPhonemizer(BasePhonemizer):
     @classmethod
     def is_supported_language(cls, language):
         """Check if language is supported"""
-        return language.lower() in ["ur", "urdu"]
+        return language.lower() in cls._SUPPORTED_LANGUAGES
 
 # Test section (only runs when file is executed directly)
 if __name__ == "__main__":
@@ -1,8 +1,15 @@
 # File: /TTS/tts/utils/text/urdu/normalize.py
 
+import functools
 import re
+import unicodedata
 from typing import List, Dict
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 # Urdu-specific normalization patterns
 URDU_NUMBER_MAP = {
     '۰': '0', '۱': '1', '۲': '2', '۳': '3', '۴': '4',
@@ -21,16 +28,48 @@ URDU_ABBREVIATIONS = {
     'مس': 'مس',
 }
 
+# Precompiled patterns used on every utterance
+_WS_RE = re.compile(r'\s+')
+_DOT_RE = re.compile(r'[۔]{2,}')
+_Q_RE = re.compile(r'[؟]{2,}')
+_EXCL_RE = re.compile(r'[!]{2,}')
+_PUNCT_SPACE_RE = re.compile(r'([۔؟!،])([^\s۔؟!،])')
+_PUNCT_SET = frozenset('۔؟!،')
+
+# Normalize different forms of the same character
+URDU_CHARACTER_VARIANTS = {
+    'ك': 'ک',  # Arabic kaf to Urdu kaf
+    'ي': 'ی',  # Arabic yeh to Urdu yeh
+    'ء': 'ٔ',  # Hamza variants
+    'أ': 'ا',  # Alif with hamza above
+    'إ': 'ا',  # Alif with hamza below
+}
+
+# Common diacritics removed for simplified processing
+URDU_DIACRITICS = ['َ', 'ِ', 'ُ', 'ً', 'ٍ', 'ٌ', 'ْ', 'ّ']
+
+# Single-pass translation tables
+_NUM_TABLE = str.maketrans(URDU_NUMBER_MAP)
+_VAR_TABLE = str.maketrans(URDU_CHARACTER_VARIANTS)
+_DIACRITIC_TABLE = str.maketrans('', '', ''.join(URDU_DIACRITICS))
+
+_VARIANT_CHARS = frozenset(URDU_CHARACTER_VARIANTS)
+
+# Variants, numerals and (optionally) diacritics folded into one table for normalize_urdu_text
+_CHAR_TABLE = {**_VAR_TABLE, **_NUM_TABLE}
+_CHAR_TABLE_NO_DIACRITICS = {**_CHAR_TABLE, **_DIACRITIC_TABLE}
+
+# Whitespace runs, repeated marks and single marks matched in one regex pass
+_FUSED_PUNCT_WS_RE = re.compile(r'(\s+)|([۔؟!])\2+|([۔؟!،])')
+
 def normalize_numbers(text: str) -> str:
     """Convert Urdu-Indic numerals to Arabic numerals"""
-    for urdu_num, arabic_num in URDU_NUMBER_MAP.items():
-        text = text.replace(urdu_num, arabic_num)
-    return text
+    return text.translate(_NUM_TABLE)
 
 def normalize_whitespace(text: str) -> str:
     """Normalize whitespace in Urdu text"""
     # Replace multiple spaces with single space
-    text = re.sub(r'\s+', ' ', text)
+    text = _WS_RE.sub(' ', text)
     # Remove leading/trailing whitespace
     text = text.strip()
     return text
@@ -38,12 +77,12 @@ def normalize_whitespace(text: str) -> str:
 def normalize_punctuation(text: str) -> str:
     """Normalize Urdu punctuation"""
     # Replace multiple punctuation with single
-    text = re.sub(r'[۔]{2,}', '۔', text)  # Multiple full stops
-    text = re.sub(r'[؟]{2,}', '؟', text)  # Multiple question marks
-    text = re.sub(r'[!]{2,}', '!', text)   # Multiple exclamations
+    text = _DOT_RE.sub('۔', text)  # Multiple full stops
+    text = _Q_RE.sub('؟', text)  # Multiple question marks
+    text = _EXCL_RE.sub('!', text)  # Multiple exclamations
     
     # Add space after punctuation if missing
-    text = re.sub(r'([۔؟!،])([^\s۔؟!،])', r'\1 \2', text)
+    text = _PUNCT_SPACE_RE.sub(r'\1 \2', text)
     
     return text
 
@@ -51,54 +90,99 @@ def normalize_diacritics(text: str, remove_diacritics: bool = False) -> str:
     """Handle Urdu diacritics"""
     if remove_diacritics:
         # Remove common diacritics for simplified processing
-        diacritics = ['َ', 'ِ', 'ُ', 'ً', 'ٍ', 'ٌ', 'ْ', 'ّ']
-        for diacritic in diacritics:
-            text = text.replace(diacritic, '')
+        text = text.translate(_DIACRITIC_TABLE)
     return text
 
 def normalize_character_variants(text: str) -> str:
-    """Normalize character variants in Urdu"""
-    # Normalize different forms of the same character
-    replacements = {
-        'ك': 'ک',  # Arabic kaf to Urdu kaf
-        'ي': 'ی',  # Arabic yeh to Urdu yeh
-        'ء': 'ٔ',  # Hamza variants
-        'أ': 'ا',  # Alif with hamza above
-        'إ': 'ا',  # Alif with hamza below
-        'آ': 'آ',  # Alif with madda (keep as is)
-    }
-    
-    for old_char, new_char in replacements.items():
-        text = text.replace(old_char, new_char)
-    
-    return text
+    """Normalize character variants in Urdu
+
+    Text is brought to Unicode NFC first, which composes decomposed letters such as
+    alif + madda. Most corpora are already NFC and free of Arabic variants, in which case
+    the text is returned untouched.
+    """
+    if unicodedata.is_normalized("NFC", text):
+        if _VARIANT_CHARS.isdisjoint(text):
+            return text
+    else:
+        text = unicodedata.normalize("NFC", text)
+    return text.translate(_VAR_TABLE)
+
+def _build_abbreviation_automaton():
+    """Compile URDU_ABBREVIATIONS into an Aho-Corasick automaton (needs `pyahocorasick`)"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for abbreviation, expansion in URDU_ABBREVIATIONS.items():
+        automaton.add_word(abbreviation, (len(abbreviation), expansion))
+    automaton.make_automaton()
+    return automaton
+
+_ABBREVIATION_AUTOMATON = _build_abbreviation_automaton()
+
+def _is_whole_word(text: str, start: int, end: int) -> bool:
+    """Check that text[start:end] is a whole word, optionally followed by one punctuation mark"""
+    if start > 0 and not text[start - 1].isspace():
+        return False
+    if end < len(text) and text[end] in _PUNCT_SET:
+        end += 1
+    return end == len(text) or text[end].isspace()
 
 def expand_abbreviations(text: str) -> str:
     """Expand common Urdu abbreviations"""
+    if _ABBREVIATION_AUTOMATON is None:
+        return _expand_abbreviations_by_word(text)
+    
+    # Single scan for every abbreviation; matches inside longer words are ignored
+    pieces = []
+    last = 0
+    for end, (length, expansion) in _ABBREVIATION_AUTOMATON.iter(text):
+        start = end - length + 1
+        if _is_whole_word(text, start, end + 1):
+            pieces.append(text[last:start])
+            pieces.append(expansion)
+            last = end + 1
+    pieces.append(text[last:])
+    
+    return ' '.join(''.join(pieces).split())
+
+def _expand_abbreviations_by_word(text: str) -> str:
+    """Word-by-word abbreviation expansion used when `pyahocorasick` is not installed"""
     words = text.split()
     expanded_words = []
     
     for word in words:
-        # Remove punctuation for matching
-        clean_word = re.sub(r'[۔؟!،]', '', word)
-        if clean_word in URDU_ABBREVIATIONS:
+        # Split off trailing punctuation for matching
+        trailing = word[-1] if word[-1] in _PUNCT_SET else ''
+        clean_word = word[:-1] if trailing else word
+        expanded = URDU_ABBREVIATIONS.get(clean_word)
+        if expanded is not None:
             # Keep original punctuation
-            punctuation = re.findall(r'[۔؟!،]', word)
-            expanded = URDU_ABBREVIATIONS[clean_word]
-            if punctuation:
-                expanded += punctuation[0]
-            expanded_words.append(expanded)
+            expanded_words.append(expanded + trailing)
         else:
             expanded_words.append(word)
     
     return ' '.join(expanded_words)
 
+def _fused_punct_ws_replacement(match: re.Match) -> str:
+    """Same result as normalize_punctuation followed by normalize_whitespace"""
+    if match.group(1):
+        return ' '
+    mark = match.group(2) or match.group(3)
+    # Add space after punctuation if missing
+    next_char = match.string[match.end():match.end() + 1]
+    if next_char and not next_char.isspace() and next_char not in _PUNCT_SET:
+        return mark + ' '
+    return mark
+
+@functools.lru_cache(maxsize=50_000)
 def normalize_urdu_text(text: str, 
                        remove_diacritics: bool = False,
                        expand_abbrev: bool = True) -> str:
     """
     Complete Urdu text normalization pipeline
     
+    Results are memoized, since training normalizes the same sentences every epoch.
+    
     Args:
         text: Input Urdu text
         remove_diacritics: Whether to remove diacritics
@@ -110,25 +194,20 @@ def normalize_urdu_text(text: str,
     if not text:
         return text
     
-    # Step 1: Normalize character variants
-    text = normalize_character_variants(text)
+    # Step 1: Unicode NFC, so decomposed letters match the tables below
+    if not unicodedata.is_normalized("NFC", text):
+        text = unicodedata.normalize("NFC", text)
     
-    # Step 2: Normalize numbers
-    text = normalize_numbers(text)
+    # Step 2: Character variants, numbers and diacritics in a single translate pass
+    text = text.translate(_CHAR_TABLE_NO_DIACRITICS if remove_diacritics else _CHAR_TABLE)
     
-    # Step 3: Handle diacritics
-    text = normalize_diacritics(text, remove_diacritics)
+    # Step 3: Punctuation and whitespace in a single regex pass
+    text = _FUSED_PUNCT_WS_RE.sub(_fused_punct_ws_replacement, text).strip()
     
-    # Step 4: Normalize punctuation
-    text = normalize_punctuation(text)
-    
-    # Step 5: Expand abbreviations if requested
-    if expand_abbrev:
+    # Step 4: Expand abbreviations if requested (all of them are in Urdu script)
+    if expand_abbrev and not text.isascii():
         text = expand_abbreviations(text)
     
-    # Step 6: Normalize whitespace (final step)
-    text = normalize_whitespace(text)
-    
     return text
 
 def preprocess_for_tts(text: str) -> str:
@@ -1,10 +1,55 @@
 # File: /TTS/tts/utils/text/urdu/phonemizer.py (Enhanced Version with Custom Dictionary)
 
-import subprocess
+import atexit
+import ctypes
+import ctypes.util
+import functools
+import logging
+import marshal
+import os
+import pickle
 import re
-from typing import Optional, Dict
+import shutil
+import subprocess
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+# normalize_urdu_text is re-exported here for backward compatibility
 from .normalize import normalize_urdu_text, preprocess_for_tts
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+logger = logging.getLogger(__name__)
+
+# libespeak-ng constants (see espeak-ng/speak_lib.h)
+_AUDIO_OUTPUT_SYNCHRONOUS = 0x02
+_ESPEAK_CHARS_UTF8 = 1
+_ESPEAK_PHONEMES_IPA = 0x02
+
+_WS_RE = re.compile(r'\s+')
+_PAREN_RE = re.compile(r'[()]+')
+_PUNCT_RE = re.compile(r'[^\w\s]')
+
+
+class _StripPunctuationTable(dict):
+    """`str.translate` table deleting every character `_PUNCT_RE` matches
+
+    Code points are classified on first sight and remembered, so cleaning a word is one
+    C-level pass instead of a regex substitution.
+    """
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        value = None if _PUNCT_RE.match(chr(codepoint)) else codepoint
+        self[codepoint] = value
+        return value
+
+
+_STRIP_PUNCT = _StripPunctuationTable()
+_REPEAT_VOWEL_RE = re.compile(r'([aiu])\1+')
+
 # Custom phoneme dictionary for problematic words
 CUSTOM_PHONEME_DICT = {
     "السلام علیکم": "æsːælɑːmu ʔælæikʊm", 
@@ -32,228 +77,692 @@ CUSTOM_PHONEME_DICT = {
 def add_custom_phoneme(word: str, phoneme: str):
     """Add a new word-phoneme mapping to the custom dictionary"""
     CUSTOM_PHONEME_DICT[word.lower()] = phoneme
+    _invalidate_custom_phrases()
+
+def add_custom_phonemes(mapping: Dict[str, str]):
+    """Add many word-phoneme mappings to the custom dictionary in a single update"""
+    CUSTOM_PHONEME_DICT.update((word.lower(), phoneme) for word, phoneme in mapping.items())
+    _invalidate_custom_phrases()
+
+# Index of the multi-word CUSTOM_PHONEME_DICT entries: (automaton or None, phrases, max words).
+# Built on first use and dropped whenever the dictionary changes.
+_CUSTOM_PHRASE_INDEX = None
+
+# Callbacks run whenever CUSTOM_PHONEME_DICT changes, e.g. to clear caches kept by wrappers
+_CUSTOM_DICT_LISTENERS: List[Callable[[], None]] = []
+
+def on_custom_dict_change(callback: Callable[[], None]):
+    """Register a callback to run after every custom dictionary update"""
+    if callback not in _CUSTOM_DICT_LISTENERS:
+        _CUSTOM_DICT_LISTENERS.append(callback)
+
+def _invalidate_custom_phrases():
+    global _CUSTOM_PHRASE_INDEX
+    _CUSTOM_PHRASE_INDEX = None
+    _phonemize_with_stats.cache_clear()
+    for callback in _CUSTOM_DICT_LISTENERS:
+        callback()
+
+def _custom_phrase_index():
+    global _CUSTOM_PHRASE_INDEX
+    if _CUSTOM_PHRASE_INDEX is None:
+        phrases = {k: v for k, v in CUSTOM_PHONEME_DICT.items() if ' ' in k}
+        max_words = max((len(k.split(' ')) for k in phrases), default=0)
+        automaton = None
+        if ahocorasick is not None and phrases:
+            automaton = ahocorasick.Automaton()
+            for phrase, phoneme in phrases.items():
+                automaton.add_word(phrase, (len(phrase), len(phrase.split(' ')), phoneme))
+            automaton.make_automaton()
+        _CUSTOM_PHRASE_INDEX = (automaton, phrases, max_words)
+    return _CUSTOM_PHRASE_INDEX
+
+def _match_custom_phrases(clean_words: List[str]) -> Dict[int, Tuple[int, str]]:
+    """Find multi-word custom dictionary entries in a cleaned word sequence
+
+    Returns:
+        Map from the index of a phrase's first word to (word count, phoneme), keeping the
+        longest phrase that starts at each word
+    """
+    automaton, phrases, max_words = _custom_phrase_index()
+    spans = {}
+    if not phrases or len(clean_words) < 2:
+        return spans
+    
+    if automaton is None:
+        # Probe every word n-gram, longest first, when `pyahocorasick` is not installed
+        for i in range(len(clean_words) - 1):
+            for n in range(min(max_words, len(clean_words) - i), 1, -1):
+                phoneme = phrases.get(' '.join(clean_words[i:i + n]))
+                if phoneme is not None:
+                    spans[i] = (n, phoneme)
+                    break
+        return spans
     
+    # Single automaton scan over the whole utterance; matches must start and end on words
+    text = ' '.join(clean_words)
+    word_starts = {}
+    offset = 0
+    for i, clean_word in enumerate(clean_words):
+        word_starts[offset] = i
+        offset += len(clean_word) + 1
+    for end, (length, n_words, phoneme) in automaton.iter(text):
+        i = word_starts.get(end - length + 1)
+        if i is None or (end + 1 < len(text) and text[end + 1] != ' '):
+            continue
+        if n_words > spans.get(i, (0, ''))[0]:
+            spans[i] = (n_words, phoneme)
+    return spans
+    
+def _parse_phoneme_file(file_path: str) -> Dict[str, str]:
+    """Parse a word|phoneme text file into a dictionary"""
+    # Read the whole file through a large buffer instead of line-by-line
+    with open(file_path, 'r', encoding='utf-8', buffering=1 << 16) as f:
+        lines = f.read().splitlines()
+    
+    mapping = {}
+    for line in lines:
+        line = line.strip()
+        if line and '|' in line:
+            word, phoneme = line.split('|', 1)
+            mapping[word.strip()] = phoneme.strip()
+    return mapping
+
+def _read_phoneme_file(file_path: str) -> Dict[str, str]:
+    """Read a word|phoneme file through a marshalled copy stored next to it
+    
+    The copy (`<file_path>.marshal`) is used while it is at least as new as the text file,
+    otherwise the text is parsed and the copy is rewritten for the next process. marshal
+    loads a dict of strings faster than pickle, which matters for large lexicons.
+    """
+    cache_path = file_path + ".marshal"
+    try:
+        if os.path.getmtime(cache_path) >= os.path.getmtime(file_path):
+            with open(cache_path, 'rb') as f:
+                mapping = marshal.loads(f.read())
+            if isinstance(mapping, dict):
+                return mapping
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+    
+    mapping = _parse_phoneme_file(file_path)
+    try:
+        # write then rename, so concurrent readers never see a partial file
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(marshal.dumps(mapping))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+    return mapping
+
 def load_custom_phonemes_from_file(file_path: str):
     """Load custom phonemes from a file (word|phoneme format)"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if line and '|' in line:
-                    word, phoneme = line.split('|', 1)
-                    CUSTOM_PHONEME_DICT[word.lower().strip()] = phoneme.strip()
+        mapping = _read_phoneme_file(file_path)
+    except FileNotFoundError:
+        logger.warning("Custom phoneme file not found: %s", file_path)
+        return
+    add_custom_phonemes(mapping)
+
+# Optional pronunciation lexicon (word|phoneme per line, e.g. an offline espeak-ng dump or
+# a CLE-style Urdu lexicon) merged into CUSTOM_PHONEME_DICT on first use, so espeak only
+# sees out-of-vocabulary words. Override the location with URDU_LEXICON_PATH.
+URDU_LEXICON_PATH = os.environ.get(
+    "URDU_LEXICON_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "urdu_lexicon.txt")
+)
+_LEXICON_LOADED = False
+
+def load_urdu_lexicon(file_path: Optional[str] = None) -> int:
+    """Merge a pronunciation lexicon into the custom dictionary
+    
+    Entries already in CUSTOM_PHONEME_DICT win, so hand-written fixes are kept.
+    
+    Args:
+        file_path: Lexicon file, defaults to URDU_LEXICON_PATH
+    
+    Returns:
+        Number of lexicon entries added
+    """
+    global _LEXICON_LOADED
+    _LEXICON_LOADED = True
+    try:
+        lexicon = _read_phoneme_file(file_path or URDU_LEXICON_PATH)
     except FileNotFoundError:
-        print(f"Custom phoneme file not found: {file_path}")
+        if file_path is not None:
+            logger.warning("Urdu lexicon not found: %s", file_path)
+        return 0
+    added = {word.lower(): phoneme for word, phoneme in lexicon.items() if word.lower() not in CUSTOM_PHONEME_DICT}
+    add_custom_phonemes(added)
+    return len(added)
 
-def urdu_text_to_phonemes(text: str, use_espeak: bool = True, use_custom_dict: bool = True) -> str:
+def _needs_espeak(word: str) -> bool:
+    """Whether a word should be sent to espeak rather than kept as written"""
+    return not word.isascii() or any(c.isdigit() for c in word)
+
+def _log_word_sources(words, clean_words, word_phonemes, residual, rule_based):
+    """Log which tier phonemized each word of an utterance"""
+    residual, rule_based = set(residual), set(rule_based)
+    for i, word in enumerate(words):
+        if i not in residual:
+            logger.debug("Custom dict used for '%s': %s", clean_words[i], word_phonemes[i])
+        elif i in rule_based:
+            logger.debug("Rule-based used for '%s': %s", word, word_phonemes[i])
+        else:
+            logger.debug("Espeak used for '%s': %s", word, word_phonemes[i])
+
+def urdu_text_to_phonemes(
+    text: str, use_espeak: bool = True, use_custom_dict: bool = True, return_stats: bool = False
+):
     """
     Convert Urdu text to IPA phonemes with custom dictionary fallback
     
+    Results are memoized per text and dropped whenever the custom dictionary changes.
+    
     Args:
         text: Input Urdu text
         use_espeak: Use espeak-ng for phonemization
         use_custom_dict: Use custom dictionary for known problematic words
+        return_stats: Also return how many words each method phonemized
     
     Returns:
-        IPA phonemes string
+        IPA phonemes string, or (phonemes, {"custom", "espeak", "rule_based"} counts)
+        when `return_stats` is True
     """
+    phonemes, (custom, espeak, rule_based) = _phonemize_with_stats(text, use_espeak, use_custom_dict)
+    if return_stats:
+        return phonemes, {"custom": custom, "espeak": espeak, "rule_based": rule_based}
+    return phonemes
+
+@functools.lru_cache(maxsize=100_000)
+def _phonemize_with_stats(text: str, use_espeak: bool, use_custom_dict: bool) -> Tuple[str, Tuple[int, int, int]]:
+    if not _LEXICON_LOADED:
+        load_urdu_lexicon()
+    
     # Preprocess text first
     text = preprocess_for_tts(text)
     # Split text into words for individual processing
     words = text.split()
-    phoneme_results = []
-    
-    for word in words:
-        # Clean the word (remove punctuation for lookup)
-        clean_word = re.sub(r'[^\w\s]', '', word.lower())
-        
-        word_phoneme = ""
-        
-        # Step 1: Check custom dictionary first
-        if clean_word in CUSTOM_PHONEME_DICT:
-            word_phoneme = CUSTOM_PHONEME_DICT[clean_word]
-            print(f"Custom dict used for '{clean_word}': {word_phoneme}")
-        
-        # Step 2: If not in custom dict, try espeak
-        elif use_espeak:
-            word_phoneme = _urdu_espeak_phonemize(word)
-            if word_phoneme and len(word_phoneme.strip()) > 0:
-                print(f"Espeak used for '{word}': {word_phoneme}")
-            else:
-                # Step 3: Fallback to rule-based if espeak fails
-                word_phoneme = _urdu_rule_based_phonemize(word)
-                print(f"Rule-based used for '{word}': {word_phoneme}")
-        
-        # Step 3: Direct fallback to rule-based if espeak disabled
-        else:
-            word_phoneme = _urdu_rule_based_phonemize(word)
-            print(f"Rule-based used for '{word}': {word_phoneme}")
-        
-        # Add the result
-        if word_phoneme:
-            phoneme_results.append(word_phoneme)
+    # Clean the words (remove punctuation for lookup)
+    clean_words = [word.lower().translate(_STRIP_PUNCT) for word in words]
+    
+    # Step 1: Check custom dictionary first, multi-word entries before single words
+    word_phonemes = [CUSTOM_PHONEME_DICT.get(clean_word) for clean_word in clean_words]
+    phrase_spans = _match_custom_phrases(clean_words)
+    if phrase_spans:
+        i = 0
+        while i < len(words):
+            span = phrase_spans.get(i)
+            if span is None:
+                i += 1
+                continue
+            n_words, phoneme = span
+            word_phonemes[i:i + n_words] = [phoneme] + [""] * (n_words - 1)
+            i += n_words
+    residual = [i for i, word_phoneme in enumerate(word_phonemes) if word_phoneme is None]
+    
+    # Step 2: If not in custom dict, try espeak (one batched pass for the whole utterance).
+    # Roman-script words are left to the rule-based pass, which keeps them as written; the
+    # Urdu voice would only switch to English pronunciation for them. Numerals are ASCII
+    # after normalization but still go to espeak, which reads them out in Urdu.
+    espeak_phonemes = [""] * len(residual)
+    if use_espeak and residual:
+        espeak_slots = [j for j, i in enumerate(residual) if _needs_espeak(words[i])]
+        if espeak_slots:
+            batch = _urdu_espeak_phonemize_batch([words[residual[j]] for j in espeak_slots])
+            for j, word_phoneme in zip(espeak_slots, batch):
+                espeak_phonemes[j] = word_phoneme
+    
+    # Step 3: Fallback to rule-based if espeak fails or is disabled
+    rule_based = []
+    for i, word_phoneme in zip(residual, espeak_phonemes):
+        if not word_phoneme.strip():
+            word_phoneme = _urdu_rule_based_phonemize(words[i])
+            rule_based.append(i)
+        word_phonemes[i] = word_phoneme
+    
+    if logger.isEnabledFor(logging.DEBUG):
+        _log_word_sources(words, clean_words, word_phonemes, residual, rule_based)
+    
+    # Add the results
+    phoneme_results = [word_phoneme for word_phoneme in word_phonemes if word_phoneme]
     
     # Join all phonemes
     final_phonemes = ' '.join(phoneme_results)
     
     # Final cleanup
-    final_phonemes = re.sub(r'\s+', ' ', final_phonemes).strip()
+    final_phonemes = _WS_RE.sub(' ', final_phonemes).strip()
     
-    return final_phonemes
+    stats = (len(words) - len(residual), len(residual) - len(rule_based), len(rule_based))
+    return final_phonemes, stats
+
+class _ESpeakLibrary:
+    """Persistent in-process handle to libespeak-ng
+
+    The shared library is loaded and initialized once per process, so every word costs a
+    single `espeak_TextToPhonemes` call instead of a fork+exec of the `espeak-ng` binary
+    followed by a voice reload. libespeak-ng keeps global state and is not reentrant, so
+    loading and every phonemization call are serialized on a module-wide lock.
+    """
+
+    _instance = None
+    _load_attempted = False
+    _lock = threading.Lock()
+
+    def __init__(self, lib):
+        self._lib = lib
+        self._voice = None
+
+    @classmethod
+    def get(cls) -> Optional["_ESpeakLibrary"]:
+        """Return the process-wide library handle, or None if libespeak-ng is unavailable"""
+        if not cls._load_attempted:
+            with cls._lock:
+                if not cls._load_attempted:
+                    cls._instance = cls._load()
+                    cls._load_attempted = True
+        return cls._instance
+
+    @classmethod
+    def _load(cls) -> Optional["_ESpeakLibrary"]:
+        lib_path = ctypes.util.find_library("espeak-ng") or "libespeak-ng.so.1"
+        try:
+            lib = ctypes.cdll.LoadLibrary(lib_path)
+        except OSError:
+            return None
+
+        lib.espeak_Initialize.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_char_p, ctypes.c_int]
+        lib.espeak_Initialize.restype = ctypes.c_int
+        lib.espeak_SetVoiceByName.argtypes = [ctypes.c_char_p]
+        lib.espeak_SetVoiceByName.restype = ctypes.c_int
+        lib.espeak_TextToPhonemes.argtypes = [ctypes.POINTER(ctypes.c_void_p), ctypes.c_int, ctypes.c_int]
+        lib.espeak_TextToPhonemes.restype = ctypes.c_char_p
+
+        if lib.espeak_Initialize(_AUDIO_OUTPUT_SYNCHRONOUS, 0, None, 0) < 0:
+            return None
+        return cls(lib)
+
+    def phonemize(self, text: str, voice: str) -> str:
+        """Phonemize `text` to IPA with the given espeak voice"""
+        return " ".join(clause for clause in self.phonemize_clauses(text, voice) if clause)
+
+    def phonemize_clauses(self, text: str, voice: str) -> List[str]:
+        """Phonemize `text` and return the IPA of each clause, empty clauses included"""
+        with self._lock:
+            return self._phonemize_clauses(text, voice)
+
+    def _phonemize_clauses(self, text: str, voice: str) -> List[str]:
+        if voice != self._voice:
+            if self._lib.espeak_SetVoiceByName(voice.encode("utf-8")) != 0:
+                return []
+            self._voice = voice
+
+        # espeak_TextToPhonemes consumes one clause per call and advances the text pointer,
+        # setting it to NULL once the whole input has been processed.
+        buffer = ctypes.create_string_buffer(text.encode("utf-8"))
+        text_ptr = ctypes.c_void_p(ctypes.addressof(buffer))
+        clauses = []
+        while text_ptr.value:
+            phonemes = self._lib.espeak_TextToPhonemes(
+                ctypes.byref(text_ptr), _ESPEAK_CHARS_UTF8, _ESPEAK_PHONEMES_IPA
+            )
+            clauses.append(phonemes.decode("utf-8") if phonemes else "")
+        return clauses
+
+
+class _EspeakPipe:
+    """Long-running `espeak-ng` process fed one line at a time over stdin
+
+    Used when libespeak-ng cannot be loaded through ctypes, so the executable and its voice
+    data are loaded once per voice instead of once per word. Every request is followed by
+    a marker line whose phonemes, learned at startup, delimit the reply.
+    """
+
+    _MARKER = "espeakmarker"
+    _pipes: Dict[str, Optional["_EspeakPipe"]] = {}
+    _lock = threading.Lock()
+
+    def __init__(self, voice: str):
+        cmd = ["espeak-ng", "-q", "-v", voice, "--ipa"]
+        if shutil.which("stdbuf"):
+            # espeak-ng writes through stdio, which is block-buffered on a pipe
+            cmd = ["stdbuf", "-oL"] + cmd
+        self._proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+            bufsize=1,
+        )
+        self._write(self._MARKER)
+        self._marker_phonemes = self._read_line()
+        atexit.register(self.close)
+
+    @classmethod
+    def get(cls, voice: str) -> Optional["_EspeakPipe"]:
+        """Return the process for `voice`, starting it on first use; None if espeak-ng is missing"""
+        with cls._lock:
+            if voice not in cls._pipes:
+                try:
+                    cls._pipes[voice] = cls(voice)
+                except (OSError, BrokenPipeError):
+                    cls._pipes[voice] = None
+            return cls._pipes[voice]
+
+    @classmethod
+    def phonemize(cls, text: str, voice: str) -> str:
+        """Phonemize one line of `text` to IPA with the given voice"""
+        pipe = cls.get(voice)
+        if pipe is None:
+            return ""
+        try:
+            with cls._lock:
+                return pipe._exchange(text)
+        except (OSError, BrokenPipeError):
+            # the process died; drop it so the next call starts a fresh one
+            pipe.close()
+            with cls._lock:
+                cls._pipes.pop(voice, None)
+            return ""
+
+    def _exchange(self, text: str) -> str:
+        self._write(" ".join(text.split()) + "\n" + self._MARKER)
+        lines = []
+        while True:
+            line = self._read_line()
+            if line == self._marker_phonemes:
+                return " ".join(line for line in lines if line)
+            lines.append(line)
+
+    def _write(self, text: str):
+        self._proc.stdin.write(text + "\n")
+        self._proc.stdin.flush()
+
+    def _read_line(self) -> str:
+        line = self._proc.stdout.readline()
+        if not line:
+            raise BrokenPipeError("espeak-ng exited")
+        return line.strip()
+
+    def close(self):
+        if self._proc.poll() is None:
+            try:
+                self._proc.stdin.close()
+                self._proc.wait(timeout=1)
+            except (OSError, subprocess.TimeoutExpired):
+                self._proc.kill()
+
+
+def preload_espeak() -> bool:
+    """Load libespeak-ng (or start an `espeak-ng` process) now instead of on the first lookup
+
+    Returns:
+        True if espeak is available
+    """
+    return _ESpeakLibrary.get() is not None or _EspeakPipe.get("ur") is not None
+
+
+def _clean_espeak_output(phonemes: str) -> str:
+    """Collapse whitespace and drop espeak language-switch parentheses"""
+    phonemes = _WS_RE.sub(' ', phonemes)
+    phonemes = _PAREN_RE.sub('', phonemes)
+    return phonemes.strip()
+
+# Per-word espeak results shared by single-word and batched lookups, so vocabulary repeated
+# across utterances is only sent to espeak once
+_ESPEAK_CACHE: Dict[str, str] = {}
+_ESPEAK_CACHE_SIZE = 100_000
+# Ends a clause in every espeak voice; espeak_TextToPhonemes returns one clause per call,
+# so a batch joined with it comes back as one IPA string per word
+_ESPEAK_WORD_SEPARATOR = " . "
+DEFAULT_ESPEAK_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "urdu_phonemizer.pkl")
+
+def enable_persistent_espeak_cache(cache_path: str = DEFAULT_ESPEAK_CACHE_PATH):
+    """Load espeak results pickled by an earlier process and save them again at exit
+
+    Args:
+        cache_path: Pickle file holding the word -> IPA cache
+    """
+    try:
+        with open(cache_path, 'rb') as f:
+            _ESPEAK_CACHE.update(pickle.load(f))
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass
+    atexit.register(save_espeak_cache, cache_path)
+
+def save_espeak_cache(cache_path: str = DEFAULT_ESPEAK_CACHE_PATH):
+    """Pickle the espeak word cache to `cache_path`"""
+    try:
+        os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+        # write then rename, so concurrent readers never see a partial pickle
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(_ESPEAK_CACHE, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning("Could not save espeak cache to %s: %s", cache_path, e)
 
 def _urdu_espeak_phonemize(text: str) -> str:
     """Use espeak-ng for Urdu phonemization with better error handling"""
-    try:
-        # Try with Urdu voice first
-        cmd = ["espeak-ng", "-q", "-v", "ur", "--ipa", text]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-        
-        if result.returncode == 0 and result.stdout.strip():
-            phonemes = result.stdout.strip()
-            # Clean espeak output
-            phonemes = re.sub(r'\s+', ' ', phonemes)
-            phonemes = re.sub(r'[()]+', '', phonemes)
-            return phonemes.strip()
-        
-        # Try with Hindi voice as fallback (similar phonetics)
-        cmd = ["espeak-ng", "-q", "-v", "hi", "--ipa", text]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-        
-        if result.returncode == 0 and result.stdout.strip():
-            phonemes = result.stdout.strip()
-            phonemes = re.sub(r'\s+', ' ', phonemes)
-            phonemes = re.sub(r'[()]+', '', phonemes)
-            return phonemes.strip()
-
-    except (subprocess.TimeoutExpired, FileNotFoundError, Exception) as e:
-        print(f"Espeak failed for '{text}': {e}")
-    
-    # Return empty string to trigger rule-based fallback
+    return _urdu_espeak_phonemize_batch([text])[0]
+
+def _urdu_espeak_phonemize_batch(words: List[str]) -> List[str]:
+    """Phonemize a list of words with espeak-ng, sending all uncached words in one pass
+
+    Returns:
+        One IPA string per word; empty where espeak produced nothing
+    """
+    missing = [word for word in dict.fromkeys(words) if word not in _ESPEAK_CACHE]
+    if missing:
+        if len(_ESPEAK_CACHE) + len(missing) > _ESPEAK_CACHE_SIZE:
+            _ESPEAK_CACHE.clear()
+        _ESPEAK_CACHE.update(zip(missing, _espeak_phonemize_words(missing)))
+    return [_ESPEAK_CACHE[word] for word in words]
+
+def _espeak_phonemize_words(words: List[str]) -> List[str]:
+    espeak_lib = _ESpeakLibrary.get()
+    if espeak_lib is None:
+        if _EspeakPipe.get("ur") is None:
+            # Return empty strings to trigger rule-based fallback
+            return [""] * len(words)
+        return [_espeak_phonemize_word(_EspeakPipe.phonemize, word) for word in words]
+
+    results = [""] * len(words)
+    if len(words) > 1:
+        clauses = espeak_lib.phonemize_clauses(_ESPEAK_WORD_SEPARATOR.join(words), "ur")
+        # A word containing clause punctuation of its own shifts the alignment; redo those
+        # utterances word by word rather than guess
+        if len(clauses) == len(words):
+            results = [_clean_espeak_output(clause) for clause in clauses]
+    return [result or _espeak_phonemize_word(espeak_lib.phonemize, word) for result, word in zip(results, words)]
+
+def _espeak_phonemize_word(phonemize: Callable[[str, str], str], text: str) -> str:
+    # Try with Urdu voice first, then Hindi voice as fallback (similar phonetics)
+    for voice in ("ur", "hi"):
+        phonemes = phonemize(text, voice)
+        if phonemes.strip():
+            return _clean_espeak_output(phonemes)
     return ""
 
+# Enhanced Urdu to IPA mapping
+_URDU_TO_IPA = {
+    # Vowels (long and short)
+    'ا': 'ɑ',      # alif
+    'آ': 'ɑː',     # alif madda
+    'ای': 'eː',    # yeh with alif
+    'او': 'oː',    # waw with alif
+    'اے': 'eː',    # alif with yeh
+    'اؤ': 'əʊ',    # alif with waw
+    'ے': 'eː',     # yeh (final form)
+    'ی': 'iː',     # yeh
+    'و': 'uː',     # waw (when vowel)
+    
+    # Short vowels (diacritics)
+    'َ': 'a',      # zabar (fatha)
+    'ِ': 'i',      # zer (kasra)
+    'ُ': 'u',      # pesh (damma)
+    'ً': 'aⁿ',     # double zabar (tanween)
+    'ٍ': 'iⁿ',     # double zer
+    'ٌ': 'uⁿ',     # double pesh
+    'ْ': '',       # jazm (sukun) - no vowel
+    'ّ': '',       # shaddah (gemination marker)
+    
+    # Consonants - Stops
+    'ب': 'b',      # beh
+    'پ': 'p',      # peh
+    'ت': 't̪',     # teh (dental)
+    'ٹ': 'ʈ',      # tteh (retroflex)
+    'ث': 's',      # theh (often pronounced as 's')
+    'ج': 'd͡ʒ',     # jeem
+    'چ': 't͡ʃ',     # cheh
+    'د': 'd̪',     # dal (dental)
+    'ڈ': 'ɖ',      # ddal (retroflex)
+    'ذ': 'z',      # zal (often pronounced as 'z')
+    'ک': 'k',      # kaf
+    'گ': 'ɡ',      # gaf
+    'ق': 'q',      # qaf (often k in modern Urdu)
+    
+    # Fricatives
+    'ف': 'f',      # feh
+    'س': 's',      # seen
+    'ص': 's',      # sad (often 's' in modern Urdu)
+    'ش': 'ʃ',      # sheen
+    'خ': 'x',      # kheh
+    'غ': 'ɣ',      # ghain
+    'ح': 'ɦ',      # heh (aspirated)
+    'ہ': 'ɦ',      # heh goal
+    'ھ': 'ʰ',      # heh doachashmee (aspiration marker)
+    'ع': 'ʔ',      # ain (glottal stop in formal speech)
+    'ز': 'z',      # zain
+    'ژ': 'ʒ',      # zheh
+    'ض': 'z',      # dad (often 'z' in modern Urdu)
+    'ط': 't̪',     # tah (often dental 't')
+    'ظ': 'z',      # zah (often 'z')
+    
+    # Nasals
+    'م': 'm',      # meem
+    'ن': 'n',      # noon
+    'ں': 'ɰ̃',     # noon ghunna (nasalization)
+    
+    # Liquids
+    'ل': 'l',      # lam
+    'ر': 'r',      # reh (usually trilled)
+    'ڑ': 'ɽ',      # rreh (retroflex flap)
+    
+    # Numbers (Arabic-Indic to phonetic)
+    '۰': 'sɪfr',   # 0
+    '۱': 'ek',     # 1  
+    '۲': 'd̪oː',    # 2
+    '۳': 't̪iːn',   # 3
+    '۴': 't͡ʃaːr',  # 4
+    '۵': 'paːnt͡ʃ', # 5
+    '۶': 't͡ʃʰeː',  # 6
+    '۷': 'saːt̪',   # 7
+    '۸': 'aːʈʰ',   # 8
+    '۹': 'nəʊ',    # 9
+    
+    # Common punctuation
+    '۔': '.',      # Urdu full stop
+    '؟': '?',      # Urdu question mark
+    '،': ',',      # Urdu comma
+}
+
+
+class _RuleBasedTable(dict):
+    """`str.translate` table for `_URDU_TO_IPA` that fills in unmapped code points on demand
+
+    Whitespace becomes a single space, other ASCII passes through (for mixed text) and
+    anything else is dropped, as the old per-character loop did.
+    """
+
+    def __missing__(self, codepoint: int) -> Optional[str]:
+        char = chr(codepoint)
+        if char.isspace():
+            phoneme = ' '
+        elif char.isascii():
+            phoneme = char
+        else:
+            phoneme = None
+        self[codepoint] = phoneme
+        return phoneme
+
+
+# Semi-vowels/Glides: و and ی read as consonants at the start of a word or after a vowel,
+# and as the long vowels in _URDU_TO_IPA after a consonant
+_URDU_GLIDE_CONSONANTS = {
+    'و': 'ʋ',      # waw (when consonant)
+    'ی': 'j',      # yeh (when consonant)
+}
+
+# Two-character graphemes are first collapsed to a noncharacter code point each (U+FDD0..,
+# reserved for internal use and never in real text), so the whole mapping is then a single
+# C-level `str.translate` pass.
+_TWO_CHAR_PLACEHOLDERS = {
+    k: chr(0xFDD0 + i) for i, k in enumerate(k for k in _URDU_TO_IPA if len(k) == 2)
+}
+# Keyed on the first character, so text without any grapheme prefix costs a single `in`
+# check. No grapheme ends with a character another one starts with, so matches can never
+# overlap and replacing them one key at a time equals a left-to-right scan.
+_TWO_CHAR_TRIE: Dict[str, List[Tuple[str, str]]] = {}
+for _grapheme, _placeholder in _TWO_CHAR_PLACEHOLDERS.items():
+    _TWO_CHAR_TRIE.setdefault(_grapheme[0], []).append((_grapheme, _placeholder))
+del _grapheme, _placeholder
+_RULE_BASED_TABLE = _RuleBasedTable(
+    {ord(k): v or None for k, v in _URDU_TO_IPA.items() if len(k) == 1}
+)
+_RULE_BASED_TABLE.update((ord(c), _URDU_TO_IPA[k]) for k, c in _TWO_CHAR_PLACEHOLDERS.items())
+
+# Consonant readings of the glides get placeholders of their own after the graphemes'
+_GLIDE_PLACEHOLDERS = {
+    k: chr(0xFDD0 + len(_TWO_CHAR_PLACEHOLDERS) + i) for i, k in enumerate(_URDU_GLIDE_CONSONANTS)
+}
+_RULE_BASED_TABLE.update((ord(c), _URDU_GLIDE_CONSONANTS[k]) for k, c in _GLIDE_PLACEHOLDERS.items())
+# Letters after which a glide is a consonant again (two-character graphemes are vowels too)
+_URDU_VOWEL_LETTERS = frozenset('اآویے' + ''.join(_TWO_CHAR_PLACEHOLDERS.values()))
+_GLIDE_RUN_RE = re.compile('[' + ''.join(_URDU_GLIDE_CONSONANTS) + ']+')
+
+
+def _resolve_glides(match) -> str:
+    """Pick the consonant or vowel reading for each و/ی in a run, left to right"""
+    start = match.start()
+    prev = match.string[start - 1] if start else ''
+    # A glide follows a consonant only if the previous character is a non-vowel letter
+    after_consonant = prev.isalpha() and prev not in _URDU_VOWEL_LETTERS
+    resolved = []
+    for char in match.group():
+        if after_consonant:
+            resolved.append(char)
+        else:
+            resolved.append(_GLIDE_PLACEHOLDERS[char])
+        after_consonant = not after_consonant
+    return ''.join(resolved)
+
+
+def _collapse_two_char_graphemes(text: str) -> str:
+    for first, graphemes in _TWO_CHAR_TRIE.items():
+        if first in text:
+            for grapheme, placeholder in graphemes:
+                text = text.replace(grapheme, placeholder)
+    return text
+
+
+@functools.lru_cache(maxsize=65536)
 def _urdu_rule_based_phonemize(text: str) -> str:
     """
     Enhanced rule-based Urdu to IPA conversion
     Based on Urdu phonology and improved mapping
     """
+    if text.isascii():
+        # Nothing in _URDU_TO_IPA is ASCII, so the mapping would copy the text unchanged
+        return _apply_urdu_phonetic_rules(text)
     
-    # Enhanced Urdu to IPA mapping
-    urdu_to_ipa = {
-        # Vowels (long and short)
-        'ا': 'ɑ',      # alif
-        'آ': 'ɑː',     # alif madda
-        'ای': 'eː',    # yeh with alif
-        'او': 'oː',    # waw with alif
-        'اے': 'eː',    # alif with yeh
-        'اؤ': 'əʊ',    # alif with waw
-        'ے': 'eː',     # yeh (final form)
-        'ی': 'iː',     # yeh
-        'و': 'uː',     # waw (when vowel)
-        
-        # Short vowels (diacritics)
-        'َ': 'a',      # zabar (fatha)
-        'ِ': 'i',      # zer (kasra)
-        'ُ': 'u',      # pesh (damma)
-        'ً': 'aⁿ',     # double zabar (tanween)
-        'ٍ': 'iⁿ',     # double zer
-        'ٌ': 'uⁿ',     # double pesh
-        'ْ': '',       # jazm (sukun) - no vowel
-        'ّ': '',       # shaddah (gemination marker)
-        
-        # Consonants - Stops
-        'ب': 'b',      # beh
-        'پ': 'p',      # peh
-        'ت': 't̪',     # teh (dental)
-        'ٹ': 'ʈ',      # tteh (retroflex)
-        'ث': 's',      # theh (often pronounced as 's')
-        'ج': 'd͡ʒ',     # jeem
-        'چ': 't͡ʃ',     # cheh
-        'د': 'd̪',     # dal (dental)
-        'ڈ': 'ɖ',      # ddal (retroflex)
-        'ذ': 'z',      # zal (often pronounced as 'z')
-        'ک': 'k',      # kaf
-        'گ': 'ɡ',      # gaf
-        'ق': 'q',      # qaf (often k in modern Urdu)
-        
-        # Fricatives
-        'ف': 'f',      # feh
-        'ث': 's',      # theh
-        'س': 's',      # seen
-        'ص': 's',      # sad (often 's' in modern Urdu)
-        'ش': 'ʃ',      # sheen
-        'خ': 'x',      # kheh
-        'غ': 'ɣ',      # ghain
-        'ح': 'ɦ',      # heh (aspirated)
-        'ہ': 'ɦ',      # heh goal
-        'ھ': 'ʰ',      # heh doachashmee (aspiration marker)
-        'ع': 'ʔ',      # ain (glottal stop in formal speech)
-        'ز': 'z',      # zain
-        'ژ': 'ʒ',      # zheh
-        'ض': 'z',      # dad (often 'z' in modern Urdu)
-        'ط': 't̪',     # tah (often dental 't')
-        'ظ': 'z',      # zah (often 'z')
-        
-        # Nasals
-        'م': 'm',      # meem
-        'ن': 'n',      # noon
-        'ں': 'ɰ̃',     # noon ghunna (nasalization)
-        
-        # Liquids
-        'ل': 'l',      # lam
-        'ر': 'r',      # reh (usually trilled)
-        'ڑ': 'ɽ',      # rreh (retroflex flap)
-        
-        # Semi-vowels/Glides
-        'و': 'ʋ',      # waw (when consonant)
-        'ی': 'j',      # yeh (when consonant)
-        
-        # Numbers (Arabic-Indic to phonetic)
-        '۰': 'sɪfr',   # 0
-        '۱': 'ek',     # 1  
-        '۲': 'd̪oː',    # 2
-        '۳': 't̪iːn',   # 3
-        '۴': 't͡ʃaːr',  # 4
-        '۵': 'paːnt͡ʃ', # 5
-        '۶': 't͡ʃʰeː',  # 6
-        '۷': 'saːt̪',   # 7
-        '۸': 'aːʈʰ',   # 8
-        '۹': 'nəʊ',    # 9
-        
-        # Common punctuation
-        '۔': '.',      # Urdu full stop
-        '؟': '?',      # Urdu question mark
-        '،': ',',      # Urdu comma
-    }
-    
-    result = []
-    i = 0
-    
-    while i < len(text):
-        # Check for two-character combinations first
-        if i < len(text) - 1:
-            two_char = text[i:i+2]
-            if two_char in urdu_to_ipa:
-                result.append(urdu_to_ipa[two_char])
-                i += 2
-                continue
-        
-        # Single character mapping
-        char = text[i]
-        if char in urdu_to_ipa:
-            phoneme = urdu_to_ipa[char]
-            if phoneme:  # Skip empty phonemes (like jazm)
-                result.append(phoneme)
-        elif char.isspace():
-            result.append(' ')
-        elif char.isascii():
-            # Keep ASCII characters as-is (for mixed text)
-            result.append(char)
-        # Skip unknown characters
-        
-        i += 1
-    
-    # Post-processing
-    phonemes = ''.join(result)
+    # Two-character combinations first, then the position-dependent و/ی, then every
+    # single character in one pass
+    text = _collapse_two_char_graphemes(text)
+    text = _GLIDE_RUN_RE.sub(_resolve_glides, text)
+    phonemes = text.translate(_RULE_BASED_TABLE)
     
     # Handle common phonetic combinations and rules
     phonemes = _apply_urdu_phonetic_rules(phonemes)
@@ -265,20 +774,14 @@ def _apply_urdu_phonetic_rules(phonemes: str) -> str:
     
     # Rule 1: Vowel harmony and length
     # Simplify repeated vowels
-    phonemes = re.sub(r'([aiu])\1+', r'\1', phonemes)
+    phonemes = _REPEAT_VOWEL_RE.sub(r'\1', phonemes)
     
     # Rule 2: Consonant clusters
-    # Simplify some difficult consonant clusters
-    phonemes = re.sub(r'([kɡq])([ʰ])', r'\1ʰ', phonemes)  # Aspiration
-    
-    # Rule 3: Word boundaries
-    # Ensure proper spacing
-    phonemes = re.sub(r'\s+', ' ', phonemes)
+    # Aspirated stops ([kɡq] + ʰ) are already emitted in their final form
     
-    # Rule 4: Final cleanup
-    phonemes = phonemes.strip()
-    
-    return phonemes
+    # Rule 3 + 4: Word boundaries and final cleanup
+    # Collapse whitespace runs to single spaces and trim, in one C-level pass
+    return ' '.join(phonemes.split())
 
 # Utility functions for managing custom dictionary
 def export_custom_dict_to_file(file_path: str):
@@ -287,31 +790,34 @@ def export_custom_dict_to_file(file_path: str):
         for word, phoneme in sorted(CUSTOM_PHONEME_DICT.items()):
             f.write(f"{word}|{phoneme}\n")
 
-def get_phonemization_stats(text: str):
-    """Get statistics on which method was used for each word"""
-    words = text.split()
-    stats = {"custom": 0, "espeak": 0, "rule_based": 0}
+def _init_worker(custom_phonemes: Dict[str, str], use_espeak: bool):
+    """Prepare a pool worker: sync the custom dictionary and load espeak once per process"""
+    add_custom_phonemes(custom_phonemes)
+    if use_espeak:
+        preload_espeak()
+
+def batch_phonemize(texts: List[str], workers: Optional[int] = None, use_espeak: bool = True) -> List[str]:
+    """Phonemize many utterances in parallel worker processes
     
-    for word in words:
-        clean_word = re.sub(r'[^\w\s]', '', word.lower())
-        
-        if clean_word in CUSTOM_PHONEME_DICT:
-            stats["custom"] += 1
-        else:
-            espeak_result = _urdu_espeak_phonemize(word)
-            if espeak_result and len(espeak_result.strip()) > 0:
-                stats["espeak"] += 1
-            else:
-                stats["rule_based"] += 1
+    Meant for corpus preprocessing, where utterances are independent. Each worker holds its
+    own espeak instance, initialized once when the worker starts.
+    
+    Args:
+        texts: Utterances to phonemize
+        workers: Number of processes, defaults to the CPU count
+        use_espeak: Use espeak-ng for phonemization
     
-    return stats
+    Returns:
+        IPA phonemes for each text, in input order
+    """
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(dict(CUSTOM_PHONEME_DICT), use_espeak)
+    ) as pool:
+        return list(pool.map(functools.partial(urdu_text_to_phonemes, use_espeak=use_espeak), texts, chunksize=64))
 
-# Keep the original normalize function for backward compatibility
-def normalize_urdu_text(text: str) -> str:
-    """Normalize Urdu text for better phonemization"""
-    # Use the enhanced normalize function
-    from .normalize import normalize_urdu_text as enhanced_normalize
-    return enhanced_normalize(text)
+def get_phonemization_stats(text: str):
+    """Get statistics on which method was used for each word"""
+    return urdu_text_to_phonemes(text, return_stats=True)[1]
 
 # Example usage and testing
 if __name__ == "__main__":
@@ -326,7 +832,6 @@ if __name__ == "__main__":
     
     for text in test_texts:
         print(f"\nText: {text}")
-        phonemes = urdu_text_to_phonemes(text)
+        phonemes, stats = urdu_text_to_phonemes(text, return_stats=True)
         print(f"Phonemes: {phonemes}")
-        stats = get_phonemization_stats(text)
         print(f"Stats: {stats}")
@@ -0,0 +1,131 @@
+# File: /TTS/tts/utils/text/urdu/phonemizer_server.py (Long-running Urdu phonemizer service)
+"""Serve Urdu phonemization from one long-lived process over a pair of named pipes
+
+Loading the lexicon and initializing espeak happens once in the server; clients write one
+`<request id>\t<utterance>` line and read back `<request id>\t<IPA>`, instead of importing
+the phonemizer and paying that start-up cost themselves. The pipes carry one client at a
+time; clients take a lock file next to them for the length of an exchange and skip any
+reply left over from a client that hung up. By default the pipes live in a directory only
+the current user can access.
+
+    python -m TTS.tts.utils.text.urdu.phonemizer_server
+"""
+
+import argparse
+import fcntl
+import itertools
+import logging
+import os
+import stat
+import tempfile
+
+from .phonemizer import load_urdu_lexicon, preload_espeak, urdu_text_to_phonemes
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PIPE_DIR = os.path.join(
+    os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir(), f"urdu_phonemizer-{os.getuid()}"
+)
+DEFAULT_IN_PIPE = os.path.join(DEFAULT_PIPE_DIR, "in")
+DEFAULT_OUT_PIPE = os.path.join(DEFAULT_PIPE_DIR, "out")
+
+_REQUEST_IDS = itertools.count()
+
+
+def _ensure_private_dir(path: str):
+    """Create `path` for the current user only, refusing a directory someone else controls"""
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise RuntimeError(f" [!] {path} must be a directory private to the current user.")
+
+
+def _check_fifo(path: str):
+    """Make sure `path` is a named pipe owned by the current user, not a file or symlink"""
+    info = os.lstat(path)
+    if not stat.S_ISFIFO(info.st_mode) or info.st_uid != os.getuid():
+        raise RuntimeError(f" [!] {path} exists but is not a named pipe owned by the current user.")
+
+
+def _ensure_fifo(path: str):
+    try:
+        os.mkfifo(path, 0o600)
+    except FileExistsError:
+        _check_fifo(path)
+
+
+def serve(in_pipe: str = DEFAULT_IN_PIPE, out_pipe: str = DEFAULT_OUT_PIPE, use_espeak: bool = True):
+    """Answer phonemization requests until interrupted
+
+    Args:
+        in_pipe: FIFO the server reads utterances from, created if missing
+        out_pipe: FIFO the server writes phonemes to, created if missing
+        use_espeak: Use espeak-ng for phonemization
+    """
+    for path in {os.path.dirname(in_pipe), os.path.dirname(out_pipe)} & {DEFAULT_PIPE_DIR}:
+        _ensure_private_dir(path)
+    _ensure_fifo(in_pipe)
+    _ensure_fifo(out_pipe)
+    load_urdu_lexicon()
+    if use_espeak:
+        preload_espeak()
+    logger.info("Urdu phonemizer serving on %s -> %s", in_pipe, out_pipe)
+
+    while True:
+        # Both opens block until a client connects; EOF on the request pipe ends the session
+        try:
+            with open(in_pipe, "r", encoding="utf-8") as requests, open(out_pipe, "w", encoding="utf-8") as replies:
+                for line in requests:
+                    request_id, _, text = line.rstrip("\n").partition("\t")
+                    replies.write(f"{request_id}\t{urdu_text_to_phonemes(text.strip(), use_espeak=use_espeak)}\n")
+                    replies.flush()
+        except BrokenPipeError:
+            # the client went away before reading its reply; only its session ends
+            logger.warning("Client disconnected before reading its reply")
+
+
+def phonemize_via_service(
+    text: str, in_pipe: str = DEFAULT_IN_PIPE, out_pipe: str = DEFAULT_OUT_PIPE, max_attempts: int = 3
+) -> str:
+    """Phonemize `text` with a running `serve` process
+
+    Safe to call from several processes at once (e.g. DataLoader workers): an exclusive
+    lock on `<in_pipe>.lock` keeps one exchange on the pipes at a time, and replies carrying
+    another request's id are skipped. If the server drops the session mid-exchange the
+    request is sent again, up to `max_attempts` times.
+    """
+    _check_fifo(in_pipe)
+    _check_fifo(out_pipe)
+    request_id = f"{os.getpid()}-{next(_REQUEST_IDS)}"
+    lock_fd = os.open(in_pipe + ".lock", os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(lock_fd, fcntl.LOCK_EX)
+        for _ in range(max_attempts):
+            try:
+                with open(in_pipe, "w", encoding="utf-8") as requests, open(out_pipe, "r", encoding="utf-8") as replies:
+                    requests.write(f"{request_id}\t{' '.join(text.split())}\n")
+                    requests.flush()
+                    for reply in replies:
+                        reply_id, _, phonemes = reply.rstrip("\n").partition("\t")
+                        if reply_id == request_id:
+                            return phonemes
+            except BrokenPipeError:
+                pass
+    finally:
+        # closing the descriptor releases the lock
+        os.close(lock_fd)
+    raise RuntimeError(f" [!] No reply from the Urdu phonemizer service on {in_pipe} after {max_attempts} attempts.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve Urdu phonemization over named pipes")
+    parser.add_argument("--in_pipe", default=DEFAULT_IN_PIPE, help="FIFO to read utterances from")
+    parser.add_argument("--out_pipe", default=DEFAULT_OUT_PIPE, help="FIFO to write phonemes to")
+    parser.add_argument("--no_espeak", action="store_true", help="Skip espeak-ng and use the rule-based fallback")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    serve(args.in_pipe, args.out_pipe, use_espeak=not args.no_espeak)
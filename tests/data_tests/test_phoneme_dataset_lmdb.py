@@ -0,0 +1,47 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from TTS.tts.datasets.dataset import PhonemeDataset, lmdb
+
+
+class _CountingTokenizer:
+    """Tokenizer that maps characters to code points and counts how often it runs"""
+
+    pad_id = 0
+
+    def __init__(self):
+        self.calls = 0
+
+    def text_to_ids(self, text, language=None):
+        self.calls += 1
+        return [ord(char) for char in text]
+
+    def ids_to_text(self, ids):
+        return "".join(chr(i) for i in ids)
+
+
+@unittest.skipIf(lmdb is None, "needs the `lmdb` package")
+class TestPhonemeDatasetLMDB(unittest.TestCase):
+    def setUp(self):
+        self.samples = [
+            {"audio_unique_name": f"speaker#clip_{i}", "text": f"text {i}", "language": "en"} for i in range(5)
+        ]
+
+    def test_cache_is_reused(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_path = os.path.join(tmp_dir, "phonemes.lmdb")
+            tokenizer = _CountingTokenizer()
+            dataset = PhonemeDataset(self.samples, tokenizer, cache_path)
+            self.assertEqual(tokenizer.calls, len(self.samples))
+
+            # a second dataset on the same path must read the cache instead of tokenizing again
+            tokenizer = _CountingTokenizer()
+            dataset = PhonemeDataset(self.samples, tokenizer, cache_path)
+            for index, sample in enumerate(self.samples):
+                item = dataset[index]
+                self.assertEqual(item["ph_hat"], sample["text"])
+                np.testing.assert_array_equal(item["token_ids"], [ord(char) for char in sample["text"]])
+            self.assertEqual(tokenizer.calls, 0)
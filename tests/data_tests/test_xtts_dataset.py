@@ -0,0 +1,65 @@
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import torch
+
+from TTS.tts.layers.xtts.trainer.dataset import XTTSDataset
+
+
+def _config(use_length_sampler):
+    model_args = SimpleNamespace(
+        debug_loading_failures=False,
+        max_conditioning_length=100,
+        min_conditioning_length=50,
+        max_wav_length=1000,
+        max_text_length=100,
+        gpt_use_masking_gt_prompt_approach=True,
+    )
+    return SimpleNamespace(model_args=model_args, training_seed=1, use_length_sampler=use_length_sampler)
+
+
+def _load_item(sample):
+    """Stand-in for `XTTSDataset.load_item` that fails on samples marked `broken`"""
+    if sample.get("broken"):
+        raise ValueError(sample["audio_file"])
+    return torch.ones(5, dtype=torch.int32), sample["audio_file"], torch.zeros(1, 500), torch.zeros(1, 100), torch.nan, [0, 100]
+
+
+class TestXTTSDataset(unittest.TestCase):
+    def setUp(self):
+        self.samples = [
+            {"audio_file": f"{lang}_{i}.wav", "text": "text", "language": lang, "ref_file": "null"}
+            for lang in ["en", "ur"]
+            for i in range(4)
+        ]
+        patcher = mock.patch.object(XTTSDataset, "load_item", side_effect=_load_item)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_length_sampler_index_mapping(self):
+        dataset = XTTSDataset(_config(True), self.samples, None, 22050)
+        self.assertEqual(len(dataset), len(dataset.indexed_samples))
+        self.assertEqual(
+            sorted(sample["audio_file"] for sample in dataset.indexed_samples),
+            sorted(sample["audio_file"] for sample in self.samples),
+        )
+        # the sampler picks the sample, so every index must load the sample at that position
+        for index, sample in enumerate(dataset.indexed_samples):
+            self.assertEqual(dataset[index]["filenames"], sample["audio_file"])
+
+    def test_length_sampler_replaces_failed_sample(self):
+        broken = self.samples[0]
+        broken["broken"] = True
+        dataset = XTTSDataset(_config(True), self.samples, None, 22050)
+        index = dataset.indexed_samples.index(broken)
+        for _ in range(10):
+            self.assertNotEqual(dataset[index]["filenames"], broken["audio_file"])
+        self.assertIn(str(index), dataset.failed_samples)
+
+    def test_length_sampler_gives_up(self):
+        for sample in self.samples:
+            sample["broken"] = True
+        dataset = XTTSDataset(_config(True), self.samples, None, 22050)
+        with self.assertRaises(RuntimeError):
+            dataset[0]
@@ -0,0 +1,77 @@
+import ctypes
+import unittest
+from unittest import mock
+
+from TTS.tts.utils.text.urdu import phonemizer as backend
+
+_CLAUSE_ENDS = ".،۔"
+
+
+class _FakeESpeak:
+    """Stand-in for libespeak-ng that ends a clause at every `.`, `،` or `۔`
+
+    Like `espeak_TextToPhonemes`, each call consumes one clause, advances the text pointer
+    and sets it to NULL at the end of the input. The "phonemes" are the clause text in
+    slashes.
+    """
+
+    def __init__(self):
+        self.voices = []
+
+    def espeak_SetVoiceByName(self, name):
+        self.voices.append(name.decode("utf-8"))
+        return 0
+
+    def espeak_TextToPhonemes(self, text_ptr, text_mode, phoneme_mode):
+        pointer = text_ptr._obj
+        text = ctypes.string_at(pointer.value).decode("utf-8")
+        end = min((text.find(c) for c in _CLAUSE_ENDS if c in text), default=len(text) - 1)
+        clause = text[: end + 1]
+        rest = len(text) - len(clause)
+        pointer.value = pointer.value + len(clause.encode("utf-8")) if rest else None
+        clause = clause.strip(" " + _CLAUSE_ENDS)
+        return f"/{clause}/".encode("utf-8") if clause else b""
+
+
+class TestUrduESpeakBatching(unittest.TestCase):
+    def setUp(self):
+        self.espeak = backend._ESpeakLibrary(_FakeESpeak())
+        for patcher in (
+            mock.patch.object(backend._ESpeakLibrary, "get", return_value=self.espeak),
+            mock.patch.dict(backend._ESPEAK_CACHE, clear=True),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_one_pass_per_batch(self):
+        words = ["کتاب", "قلم", "کتاب", "گھر"]
+        with mock.patch.object(self.espeak, "phonemize_clauses", wraps=self.espeak.phonemize_clauses) as clauses:
+            self.assertEqual(backend._urdu_espeak_phonemize_batch(words), ["/کتاب/", "/قلم/", "/کتاب/", "/گھر/"])
+        # every distinct word goes out in a single call
+        self.assertEqual(clauses.call_count, 1)
+        # and later lookups are served from the word cache
+        with mock.patch.object(self.espeak, "phonemize_clauses") as clauses:
+            self.assertEqual(backend._urdu_espeak_phonemize_batch(["قلم"]), ["/قلم/"])
+        clauses.assert_not_called()
+
+    def test_clause_mismatch_falls_back_to_words(self):
+        # the comma inside the first word yields an extra clause, so the batch cannot be aligned
+        words = ["ہاں،جی", "قلم"]
+        with mock.patch.object(self.espeak, "phonemize_clauses", wraps=self.espeak.phonemize_clauses) as clauses:
+            self.assertEqual(backend._urdu_espeak_phonemize_batch(words), ["/ہاں/ /جی/", "/قلم/"])
+        self.assertEqual(clauses.call_count, 1 + len(words))
+
+    def test_numerals_go_to_espeak(self):
+        backend._phonemize_with_stats.cache_clear()
+        self.addCleanup(backend._phonemize_with_stats.cache_clear)
+        with mock.patch.object(
+            backend, "_urdu_espeak_phonemize_batch", side_effect=lambda words: [f"/{w}/" for w in words]
+        ) as batch:
+            phonemes, stats = backend.urdu_text_to_phonemes("میرے پاس ۱۲۳ ok روپے ہیں", return_stats=True)
+        # Urdu digits are ASCII after normalization, but espeak still has to read them out;
+        # Roman-script words are kept as written
+        sent = batch.call_args[0][0]
+        self.assertIn("123", sent)
+        self.assertNotIn("ok", sent)
+        self.assertIn("/123/", phonemes)
+        self.assertEqual(stats["rule_based"], 1)
@@ -0,0 +1,52 @@
+import random
+import unittest
+
+from TTS.tts.utils.text.urdu import normalize
+
+
+def _normalize_by_steps(text, remove_diacritics=False):
+    """Run the individual normalization steps one after another"""
+    text = normalize.normalize_character_variants(text)
+    text = normalize.normalize_numbers(text)
+    text = normalize.normalize_diacritics(text, remove_diacritics)
+    text = normalize.normalize_punctuation(text)
+    text = normalize.expand_abbreviations(text)
+    return normalize.normalize_whitespace(text)
+
+
+class TestUrduNormalize(unittest.TestCase):
+    def test_expand_abbreviations(self):
+        self.assertEqual(normalize.expand_abbreviations("ڈاکٹر۔ صاحب"), "ڈاکٹر۔ صاحب")
+        self.assertEqual(normalize.expand_abbreviations("جناب،  محترم"), "جناب، محترم")
+        # only a trailing mark is split off; leading and interior marks stay where they are
+        self.assertEqual(normalize.expand_abbreviations("،مس"), "،مس")
+        self.assertEqual(normalize.expand_abbreviations("ڈاک،ٹر"), "ڈاک،ٹر")
+
+    def test_normalize_matches_steps(self):
+        texts = [
+            "یہ   ایک    ٹیسٹ ہے۔۔۔",
+            "سلام علیکم! آپ کیسے ہیں؟؟",
+            "۱۲۳ نمبر گھر میں ڈاکٹر صاحب رہتے ہیں۔",
+            "كتاب يہاں ہے،اور وہاں بھی",
+            "مَیں نے کہا!!وہ آئے",
+            "ا\u0653پ کا نام",
+        ]
+        alphabet = list("۔؟!، \tا\u0653آبکيكءأإ۱۲۳َُِّیہ") + ["ڈاکٹر", "صاحب", "مس"]
+        rng = random.Random(0)
+        texts += ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 15))) for _ in range(2000)]
+        for text in texts:
+            for remove_diacritics in (False, True):
+                self.assertEqual(
+                    normalize.normalize_urdu_text(text, remove_diacritics),
+                    _normalize_by_steps(text, remove_diacritics),
+                    repr(text),
+                )
+
+    def test_character_variants_nfc(self):
+        composed = "آپ کی کتاب"
+        decomposed = "ا\u0653پ کی کتاب"
+        self.assertEqual(normalize.normalize_character_variants(decomposed), composed)
+        self.assertEqual(normalize.normalize_urdu_text(decomposed), normalize.normalize_urdu_text(composed))
+        self.assertEqual(normalize.normalize_character_variants("كتاب يہاں"), "کتاب یہاں")
+        # clean NFC input is returned as is
+        self.assertIs(normalize.normalize_character_variants(composed), composed)
@@ -0,0 +1,85 @@
+import os
+import tempfile
+import unittest
+
+from TTS.tts.utils.text.phonemizers.urdu_phonemizer import UrduPhonemizer
+from TTS.tts.utils.text.urdu import phonemizer as backend
+
+
+class TestUrduPhonemizer(unittest.TestCase):
+    def setUp(self):
+        self._custom_dict = dict(backend.CUSTOM_PHONEME_DICT)
+        self.phonemizer = UrduPhonemizer(use_espeak=False)
+
+    def tearDown(self):
+        backend.CUSTOM_PHONEME_DICT.clear()
+        backend.CUSTOM_PHONEME_DICT.update(self._custom_dict)
+        # re-adding an entry drops every cache built from the dictionary
+        self.phonemizer.add_word_phoneme("السلام", self._custom_dict["السلام"])
+
+    def test_custom_dictionary(self):
+        self.assertEqual(backend.urdu_text_to_phonemes("السلام علیکم", use_espeak=False), "æsːælɑːmu ʔælæikʊm")
+        self.assertEqual(self.phonemizer.phonemize("السلام علیکم", separator=""), "æsːælɑːmu ʔælæikʊm")
+
+    def test_add_word_phoneme(self):
+        before = self.phonemizer.phonemize("کتاب", separator="")
+        self.phonemizer.add_word_phoneme("کتاب", "kɪt̪ɑːb")
+        # the cached utterance must not keep the old pronunciation
+        self.assertNotEqual(self.phonemizer.phonemize("کتاب", separator=""), before)
+        self.assertIn("kɪt̪ɑːb", self.phonemizer.phonemize("کتاب", separator=""))
+
+    def test_phonemize_batch(self):
+        texts = ["کتاب", "السلام علیکم", "وقت روز", "کتاب"]
+        self.assertEqual(
+            self.phonemizer.phonemize_batch(texts, separator="|"),
+            [self.phonemizer.phonemize(text, separator="|") for text in texts],
+        )
+
+    def test_phonemize_parallel(self):
+        self.phonemizer.add_word_phoneme("کتاب", "kɪt̪ɑːb")
+        texts = ["کتاب", "السلام علیکم", "وقت روز", "کتاب"]
+        # workers get a copy of the custom dictionary
+        self.assertEqual(
+            self.phonemizer.phonemize_parallel(texts, separator="|", n_workers=2),
+            [self.phonemizer.phonemize(text, separator="|") for text in texts],
+        )
+
+    def test_batch_phonemize(self):
+        backend.add_custom_phoneme("کتاب", "kɪt̪ɑːb")
+        texts = ["کتاب", "السلام علیکم", "وقت روز", "کتاب"]
+        expected = [backend.urdu_text_to_phonemes(text, use_espeak=False) for text in texts]
+        self.assertIn("kɪt̪ɑːb", expected[0])
+        self.assertEqual(backend.batch_phonemize(texts, workers=2, use_espeak=False), expected)
+
+    def test_load_urdu_lexicon(self):
+        before = backend.urdu_text_to_phonemes("قلم", use_espeak=False)
+        self.phonemizer.phonemize("قلم", separator="")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            lexicon_path = os.path.join(tmp_dir, "lexicon.txt")
+            with open(lexicon_path, "w", encoding="utf-8") as f:
+                f.write("قلم|qələm\n")
+                f.write("السلام|lexicon\n")
+            self.assertEqual(backend.load_urdu_lexicon(lexicon_path), 1)
+        # entries already in the dictionary win
+        self.assertEqual(backend.CUSTOM_PHONEME_DICT["السلام"], self._custom_dict["السلام"])
+        self.assertNotIn("qələm", before)
+        self.assertIn("qələm", backend.urdu_text_to_phonemes("قلم", use_espeak=False))
+        self.assertIn("qələm", self.phonemizer.phonemize("قلم", separator=""))
+
+    def test_glides(self):
+        # consonant at the start of a word or after a vowel, long vowel after a consonant
+        self.assertEqual(backend._urdu_rule_based_phonemize("وقت"), "ʋqt̪")
+        self.assertEqual(backend._urdu_rule_based_phonemize("یار"), "jɑr")
+        self.assertEqual(backend._urdu_rule_based_phonemize("روز"), "ruːz")
+        self.assertEqual(backend._urdu_rule_based_phonemize("کیا"), "kiːɑ")
+        self.assertEqual(backend._urdu_rule_based_phonemize("دیوار"), "d̪iːʋɑr")
+        self.assertEqual(backend._urdu_rule_based_phonemize("سویا"), "suːjɑ")
+
+    def test_backend_updates_reach_wrapper(self):
+        before = self.phonemizer.phonemize("کتاب", separator="")
+        backend.add_custom_phoneme("کتاب", "kɪt̪ɑːb")
+        self.assertIn("kɪt̪ɑːb", backend.urdu_text_to_phonemes("کتاب", use_espeak=False))
+        self.assertIn("kɪt̪ɑːb", self.phonemizer.phonemize("کتاب", separator=""))
+        backend.add_custom_phonemes({"کتاب": "kɪt̪ɑːbeː"})
+        self.assertIn("kɪt̪ɑːbeː", self.phonemizer.phonemize("کتاب", separator=""))
+        self.assertNotEqual(before, self.phonemizer.phonemize("کتاب", separator=""))
@@ -0,0 +1,63 @@
+import fcntl
+import os
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from TTS.tts.utils.text.urdu import phonemizer as backend
+from TTS.tts.utils.text.urdu import phonemizer_server
+
+
+class TestUrduPhonemizerServer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        cls.in_pipe = os.path.join(cls.tmp_dir.name, "in")
+        cls.out_pipe = os.path.join(cls.tmp_dir.name, "out")
+        threading.Thread(
+            target=phonemizer_server.serve, args=(cls.in_pipe, cls.out_pipe, False), daemon=True
+        ).start()
+        while not os.path.exists(cls.out_pipe):
+            threading.Event().wait(0.01)
+
+    def _phonemize(self, text):
+        return phonemizer_server.phonemize_via_service(text, self.in_pipe, self.out_pipe)
+
+    def test_concurrent_clients_get_their_own_replies(self):
+        texts = ["السلام علیکم", "یہ ٹیسٹ ہے", "قلم"] * 10
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            replies = list(executor.map(self._phonemize, texts))
+        self.assertEqual(replies, [backend.urdu_text_to_phonemes(text, use_espeak=False) for text in texts])
+
+    def test_client_disconnect_keeps_server_alive(self):
+        with self.assertLogs(phonemizer_server.logger, "WARNING") as logs:
+            with open(self.in_pipe + ".lock", "w") as lock:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+                with open(self.in_pipe, "w", encoding="utf-8") as requests:
+                    # hang up on the reply pipe before the server answers
+                    open(self.out_pipe, "r", encoding="utf-8").close()
+                    requests.write("stale\tقلم\n")
+                for _ in range(500):
+                    if logs.records:
+                        break
+                    threading.Event().wait(0.01)
+        self.assertEqual(self._phonemize("السلام علیکم"), backend.urdu_text_to_phonemes("السلام علیکم", use_espeak=False))
+
+    def test_skips_stale_reply(self):
+        with open(self.in_pipe + ".lock", "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            # a client that sends a request and leaves without waiting for the reply
+            requests = open(self.in_pipe, "w", encoding="utf-8")
+            replies = open(self.out_pipe, "r", encoding="utf-8")
+            requests.write("stale\tقلم\n")
+            requests.flush()
+        self.assertEqual(self._phonemize("السلام علیکم"), backend.urdu_text_to_phonemes("السلام علیکم", use_espeak=False))
+        requests.close()
+        replies.close()
+
+    def test_rejects_regular_file(self):
+        path = os.path.join(self.tmp_dir.name, "not_a_pipe")
+        open(path, "w").close()
+        with self.assertRaises(RuntimeError):
+            phonemizer_server.phonemize_via_service("قلم", path, self.out_pipe)
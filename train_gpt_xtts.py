@@ -1,8 +1,18 @@
 import os
 import gc
+import json
+import hashlib
+import inspect
+import marshal
+import multiprocessing
+import requests
+from concurrent.futures import ThreadPoolExecutor
+import torch
 from trainer import Trainer, TrainerArgs
 from TTS.config.shared_configs import BaseDatasetConfig
 from TTS.tts.datasets import load_tts_samples
+from TTS.tts.datasets.formatters import coqui_items_from_rows, read_coqui_rows
+from TTS.tts.layers.xtts.tokenizer import VoiceBpeTokenizer
 from TTS.tts.layers.xtts.trainer.gpt_trainer import GPTArgs, GPTTrainer, GPTTrainerConfig, XttsAudioConfig
 from TTS.utils.manage import ModelManager
 from transformers import HfArgumentParser
@@ -10,6 +20,173 @@ from dataclasses import dataclass, field
 from typing import Optional
 import argparse
 
+class CudaPrefetcher:
+    """Iterate a DataLoader while the next batch is copied to the GPU on a side stream
+
+    The copy of batch N+1 overlaps the step on batch N; the loader must pin its memory for the
+    copies to be asynchronous. Other attributes are forwarded to the wrapped loader.
+    """
+
+    def __init__(self, loader):
+        self.loader = loader
+        self.stream = torch.cuda.Stream()
+
+    def __len__(self):
+        return len(self.loader)
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+    def _copy(self, batch):
+        if not isinstance(batch, dict):
+            return batch
+        with torch.cuda.stream(self.stream):
+            return {k: v.cuda(non_blocking=True) if torch.is_tensor(v) else v for k, v in batch.items()}
+
+    def __iter__(self):
+        batches = iter(self.loader)
+        pending = self._copy(next(batches, None))
+        while pending is not None:
+            # wait for this batch's copy only, then queue the next one behind it
+            current_stream = torch.cuda.current_stream()
+            current_stream.wait_stream(self.stream)
+            if isinstance(pending, dict):
+                for value in pending.values():
+                    if torch.is_tensor(value):
+                        value.record_stream(current_stream)
+            batch = pending
+            pending = self._copy(next(batches, None))
+            yield batch
+
+class XttsTrainer(Trainer):
+    """Trainer with optional GPU batch prefetching for XTTS GPT finetuning
+
+    Args:
+        cuda_prefetch: Copy the next training batch to the GPU while the current step runs
+    """
+
+    def __init__(self, *args, cuda_prefetch=False, **kwargs):
+        self.cuda_prefetch = cuda_prefetch
+        super().__init__(*args, **kwargs)
+
+    def get_train_dataloader(self, *args, **kwargs):
+        loader = super().get_train_dataloader(*args, **kwargs)
+        if self.cuda_prefetch and loader is not None and torch.cuda.is_available() and not self.args.use_accelerate:
+            loader = CudaPrefetcher(loader)
+        return loader
+
+def _file_sha256(path, chunk_size=1 << 20):
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+def _record_file(path, with_hash=True):
+    """Write the size (and SHA256) of a complete download to a `.sha256` sidecar"""
+    record = {"size": os.path.getsize(path), "sha256": _file_sha256(path) if with_hash else None}
+    with open(path + ".sha256", "w", encoding="utf-8") as f:
+        json.dump(record, f)
+    return record
+
+def is_cached_file_valid(path, link, strict=False):
+    """Check a cached download against its sidecar; only hash the file in `strict` mode"""
+    if not os.path.isfile(path):
+        return False
+    size = os.path.getsize(path)
+    sidecar = path + ".sha256"
+    if not os.path.isfile(sidecar):
+        # Files fetched before sidecars existed: compare once against the size the server reports
+        try:
+            expected = int(requests.head(link, allow_redirects=True, timeout=10).headers.get("content-length", 0))
+        except requests.RequestException:
+            return True  # offline, keep whatever is there
+        if expected and size != expected:
+            return False
+        _record_file(path, with_hash=strict)
+        return True
+    with open(sidecar, encoding="utf-8") as f:
+        record = json.load(f)
+    if size != record["size"]:
+        return False
+    if strict:
+        if record.get("sha256") is None:
+            _record_file(path)
+            return True
+        return _file_sha256(path) == record["sha256"]
+    return True
+
+def download_missing_files(file_links, output_folder, max_workers=4, strict=False):
+    """Download the files in `file_links` that are missing or incomplete in `output_folder`, several at a time"""
+    missing = [
+        link for link in file_links
+        if not is_cached_file_valid(os.path.join(output_folder, os.path.basename(link)), link, strict)
+    ]
+    if not missing:
+        return
+    print(f" > Downloading {', '.join(os.path.basename(link) for link in missing)}!")
+
+    def download(link):
+        ModelManager._download_model_files([link], output_folder, progress_bar=False)
+        _record_file(os.path.join(output_folder, os.path.basename(link)))
+
+    # Downloads are I/O bound; one progress bar per thread would garble the output
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(missing))) as executor:
+        list(executor.map(download, missing))
+
+def coqui_cached(root_path, meta_file, ignored_speakers=None):
+    """`coqui` formatter that reuses the CSV columns parsed by a previous run
+
+    The raw columns are marshalled next to the CSV (`<meta_file>.marshal`) and reused while the
+    copy is at least as new as the CSV, which skips re-reading and parsing it. Audio paths are
+    joined with the current `root_path` and checked for existence on every load.
+    """
+    csv_path = os.path.join(root_path, meta_file)
+    cache_path = csv_path + ".marshal"
+    rows = None
+    try:
+        if os.path.getmtime(cache_path) >= os.path.getmtime(csv_path):
+            with open(cache_path, "rb") as f:
+                rows = marshal.loads(f.read())
+            if not isinstance(rows, dict):
+                rows = None
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    if rows is None:
+        rows = read_coqui_rows(csv_path)
+        try:
+            # write then rename, so concurrent readers never see a partial file
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(marshal.dumps(rows))
+            os.replace(tmp_path, cache_path)
+        except (OSError, ValueError):
+            pass
+    return coqui_items_from_rows(rows, root_path, ignored_speakers=ignored_speakers)
+
+_WORKER_TOKENIZER = None
+
+def _init_tokenizer_worker(vocab_file):
+    global _WORKER_TOKENIZER
+    _WORKER_TOKENIZER = VoiceBpeTokenizer(vocab_file)
+
+def _tokenize_sample(text_and_language):
+    try:
+        return _WORKER_TOKENIZER.encode(*text_and_language)
+    except Exception:  # leave it to the dataset, which skips samples that fail to load
+        return None
+
+def pretokenize_samples(samples, vocab_file, num_workers=None):
+    """Tokenize every sample once in a process pool, so DataLoader workers only have to load audio"""
+    if not samples:
+        return
+    jobs = [(str(sample["text"]), sample["language"]) for sample in samples]
+    with multiprocessing.Pool(num_workers or os.cpu_count(), initializer=_init_tokenizer_worker, initargs=(vocab_file,)) as pool:
+        for sample, tokens in zip(samples, pool.imap(_tokenize_sample, jobs, chunksize=64)):
+            if tokens is not None:
+                sample["text_tokens"] = tokens
+
 def create_xtts_trainer_parser():
     parser = argparse.ArgumentParser(description="Arguments for XTTS Trainer")
     parser.add_argument("--output_path", type=str, required=True, help="Path to pretrained + checkpoint model")
@@ -23,9 +200,23 @@ def create_xtts_trainer_parser():
     parser.add_argument("--lr", type=float, default=5e-6, help="Learning rate")
     parser.add_argument("--save_step", type=int, default=5000, help="Save step")
     parser.add_argument("--restore_path", type=str, default=None, help="Path to fine-tuned checkpoint for resumption (e.g., checkpoints/GPT_XTTS_FT-[date]/best_model.pth)")  # Added
+    parser.add_argument("--pretokenize", action=argparse.BooleanOptionalAction, default=True, help="Tokenize all texts in a process pool before training instead of in the DataLoader workers")
+    parser.add_argument("--length_sampler", action="store_true", help="Batch training clips of similar length together to cut padding (samples languages by size instead of evenly)")
+    parser.add_argument("--grad_checkpointing", action="store_true", help="Recompute GPT block activations in the backward pass to fit larger batches")
+    parser.add_argument("--compile", action="store_true", help="torch.compile the GPT transformer (torch >= 2.2)")
+    parser.add_argument("--compile_mode", choices=["default", "reduce-overhead", "max-autotune"], default="default", help="torch.compile mode; reduce-overhead uses CUDA graphs, which suits small batches")
+    parser.add_argument("--strict", action="store_true", help="Verify cached checkpoints by SHA256 instead of by file size")
+    parser.add_argument("--mixed_precision", choices=["none", "fp16", "bf16"], default="none", help="Mixed precision mode (bf16 needs an Ampere or newer GPU)")
+    parser.add_argument("--tf32", action=argparse.BooleanOptionalAction, default=True, help="Let fp32 matmuls use TF32 tensor cores (Ampere or newer GPUs)")
+    parser.add_argument("--cudnn_benchmark", action="store_true", help="Let cuDNN benchmark conv algorithms per input shape (pays off when batch shapes repeat, e.g. with --length_sampler)")
+    parser.add_argument("--deterministic", action="store_true", help="Use deterministic cuDNN kernels for reproducible runs (slower)")
+    parser.add_argument("--cuda_prefetch", action="store_true", help="Copy the next batch to the GPU on a side stream during the current step (holds one extra batch in GPU memory)")
+    parser.add_argument("--optimizer", choices=["AdamW", "FusedAdamW", "AdamW8bit"], default="FusedAdamW", help="FusedAdamW runs AdamW as one CUDA kernel; AdamW8bit (bitsandbytes) keeps 8-bit optimizer state")
+    parser.add_argument("--num_workers", type=int, default=None, help="DataLoader workers, 0 loads in the main process (default: CPU count minus 2, capped at 8)")
+    parser.add_argument("--persistent_workers", action=argparse.BooleanOptionalAction, default=True, help="Keep DataLoader workers alive between epochs (disable if worker memory grows across epochs)")
     return parser
 
-def train_gpt(metadatas, num_epochs, batch_size, grad_acumm, output_path, max_audio_length, max_text_length, lr, weight_decay, save_step, restore_path=None):  # Added restore_path
+def train_gpt(metadatas, num_epochs, batch_size, grad_acumm, output_path, max_audio_length, max_text_length, lr, weight_decay, save_step, restore_path=None, persistent_workers=True, num_workers=None, mixed_precision="none", strict=False, pretokenize=True, compile_gpt=False, compile_mode="default", length_sampler=False, tf32=True, cudnn_benchmark=False, deterministic=False, cuda_prefetch=False, optimizer="FusedAdamW", grad_checkpointing=False):  # Added restore_path
     # Logging parameters
     RUN_NAME = "GPT_XTTS_FT"
     PROJECT_NAME = "XTTS_trainer"
@@ -64,10 +255,6 @@ def train_gpt(metadatas, num_epochs, batch_size, grad_acumm, output_path, max_au
     DVAE_CHECKPOINT = os.path.join(CHECKPOINTS_OUT_PATH, os.path.basename(DVAE_CHECKPOINT_LINK))
     MEL_NORM_FILE = os.path.join(CHECKPOINTS_OUT_PATH, os.path.basename(MEL_NORM_LINK))
 
-    if not os.path.isfile(DVAE_CHECKPOINT) or not os.path.isfile(MEL_NORM_FILE):
-        print(" > Downloading DVAE files!")
-        ModelManager._download_model_files([MEL_NORM_LINK, DVAE_CHECKPOINT_LINK], CHECKPOINTS_OUT_PATH, progress_bar=True)
-
     # XTTS files
     TOKENIZER_FILE_LINK = "https://coqui.gateway.scarf.sh/hf-coqui/XTTS-v2/main/vocab.json"
     XTTS_CHECKPOINT_LINK = "https://coqui.gateway.scarf.sh/hf-coqui/XTTS-v2/main/model.pth"
@@ -76,15 +263,12 @@ def train_gpt(metadatas, num_epochs, batch_size, grad_acumm, output_path, max_au
     XTTS_CHECKPOINT = os.path.join(CHECKPOINTS_OUT_PATH, os.path.basename(XTTS_CHECKPOINT_LINK))
     XTTS_CONFIG_FILE = os.path.join(CHECKPOINTS_OUT_PATH, os.path.basename(XTTS_CONFIG_LINK))
 
-    if not os.path.isfile(TOKENIZER_FILE):
-        print(" > Downloading XTTS v2.0 tokenizer!")
-        ModelManager._download_model_files([TOKENIZER_FILE_LINK], CHECKPOINTS_OUT_PATH, progress_bar=True)
-    if not os.path.isfile(XTTS_CHECKPOINT):
-        print(" > Downloading XTTS v2.0 checkpoint!")
-        ModelManager._download_model_files([XTTS_CHECKPOINT_LINK], CHECKPOINTS_OUT_PATH, progress_bar=True)
-    if not os.path.isfile(XTTS_CONFIG_FILE):
-        print(" > Downloading XTTS v2.0 config!")
-        ModelManager._download_model_files([XTTS_CONFIG_LINK], CHECKPOINTS_OUT_PATH, progress_bar=True)
+    # Fetch the DVAE and XTTS files in one concurrent pass
+    download_missing_files(
+        [MEL_NORM_LINK, DVAE_CHECKPOINT_LINK, TOKENIZER_FILE_LINK, XTTS_CHECKPOINT_LINK, XTTS_CONFIG_LINK],
+        CHECKPOINTS_OUT_PATH,
+        strict=strict,
+    )
 
     # Model args
     model_args = GPTArgs(
@@ -111,6 +295,15 @@ def train_gpt(metadatas, num_epochs, batch_size, grad_acumm, output_path, max_au
     config = GPTTrainerConfig()
     config.load_json(XTTS_CONFIG_FILE)
     config.epochs = num_epochs
+    # The trainer runs the step under torch.autocast and adds a GradScaler for fp16
+    config.mixed_precision = mixed_precision != "none"
+    if config.mixed_precision:
+        config.precision = mixed_precision
+    # The trainer sets torch.backends.cuda.matmul.allow_tf32 from this; GPUs before Ampere ignore it
+    config.allow_tf32 = tf32
+    # Benchmarking is off by default: batches are padded to their longest clip, so shapes vary a lot
+    config.cudnn_benchmark = cudnn_benchmark and not deterministic
+    config.cudnn_deterministic = deterministic
     config.use_phonemes = True
     config.phonemizer = "urdu_phonemizer"
     config.phoneme_cache_path = "/kaggle/working/phoneme_cache"
@@ -124,7 +317,11 @@ def train_gpt(metadatas, num_epochs, batch_size, grad_acumm, output_path, max_au
     config.logger_uri = LOGGER_URI
     config.audio = audio_config
     config.batch_size = BATCH_SIZE
-    config.num_loader_workers = 4
+    # Leave a couple of cores to the training process; using every core stalls DDP runs
+    config.num_loader_workers = num_workers if num_workers is not None else max(1, min((os.cpu_count() or 1) - 2, 8))
+    config.pin_memory = True
+    config.persistent_workers = persistent_workers
+    config.use_length_sampler = length_sampler
     config.eval_split_max_size = 256
     config.print_step = 50
     config.plot_step = 100
@@ -133,9 +330,12 @@ def train_gpt(metadatas, num_epochs, batch_size, grad_acumm, output_path, max_au
     config.save_n_checkpoints = 1
     config.save_checkpoints = True
     config.print_eval = False
-    config.optimizer = "AdamW"
+    config.optimizer = "AdamW8bit" if optimizer == "AdamW8bit" else "AdamW"
     config.optimizer_wd_only_on_weights = OPTIMIZER_WD_ONLY_ON_WEIGHTS
     config.optimizer_params = {"betas": [0.9, 0.96], "eps": 1e-8, "weight_decay": weight_decay}
+    # The fused kernel needs torch >= 2.0 and CUDA parameters; otherwise stay on the default implementation
+    if optimizer == "FusedAdamW" and torch.cuda.is_available() and "fused" in inspect.signature(torch.optim.AdamW).parameters:
+        config.optimizer_params["fused"] = True
     config.lr = lr
     config.lr_scheduler = "MultiStepLR"
     config.lr_scheduler_params = {"milestones": [50000 * 18, 150000 * 18, 300000 * 18], "gamma": 0.5, "last_epoch": -1}
@@ -143,17 +343,32 @@ def train_gpt(metadatas, num_epochs, batch_size, grad_acumm, output_path, max_au
 
     # Initialize model
     model = GPTTrainer.init_from_config(config)
+    if grad_checkpointing:
+        # Keep only each GPT-2 block's inputs and recompute the rest in backward; the KV cache is useless then
+        model.xtts.gpt.gpt.config.use_cache = False
+        model.xtts.gpt.gpt.gradient_checkpointing_enable(gradient_checkpointing_kwargs={"use_reentrant": False})
+    if compile_gpt:
+        # Compile only the GPT-2 stack, in place so checkpoint keys keep their names; the conditioning
+        # encoder and perceiver resampler see variable-length references and would keep recompiling
+        if hasattr(torch.nn.Module, "compile"):
+            model.xtts.gpt.gpt.compile(mode=compile_mode)
+        else:
+            print(" > torch.compile of a module in place needs torch >= 2.2, training in eager mode!")
 
     # Load training samples
     train_samples, eval_samples = load_tts_samples(
         DATASETS_CONFIG_LIST,
         eval_split=True,
+        formatter=coqui_cached,
         eval_split_max_size=config.eval_split_max_size,
         eval_split_size=config.eval_split_size,
     )
+    if pretokenize:
+        print(" > Tokenizing training texts!")
+        pretokenize_samples(train_samples + eval_samples, TOKENIZER_FILE)
 
     # Initialize trainer
-    trainer = Trainer(
+    trainer = XttsTrainer(
         TrainerArgs(
             restore_path=restore_path,  # Use provided restore_path
             skip_train_epoch=False,
@@ -165,19 +380,25 @@ def train_gpt(metadatas, num_epochs, batch_size, grad_acumm, output_path, max_au
         model=model,
         train_samples=train_samples,
         eval_samples=eval_samples,
+        cuda_prefetch=cuda_prefetch,
     )
     trainer.fit()
 
     # Get longest text audio for speaker reference
-    samples_len = [len(item["text"].split(" ")) for item in train_samples]
-    longest_text_idx = samples_len.index(max(samples_len))
+    # Word count is the number of separators plus one, so counting spaces ranks samples the same
+    longest_text_idx = max(range(len(train_samples)), key=lambda i: train_samples[i]["text"].count(" "))
     speaker_ref = train_samples[longest_text_idx]["audio_file"]
 
     trainer_out_path = trainer.output_path
 
-    # Clean up
+    # Clean up; the trainer and model hold reference cycles, so collect them before
+    # handing the cached CUDA blocks back to the driver for a following train_gpt call
     del model, trainer, train_samples, eval_samples
     gc.collect()
+    if torch.cuda.is_available():
+        torch.cuda.synchronize()
+        torch.cuda.empty_cache()
+        torch.cuda.ipc_collect()
 
     return trainer_out_path
 
@@ -196,7 +417,21 @@ if __name__ == "__main__":
         max_text_length=args.max_text_length,
         max_audio_length=args.max_audio_length,
         save_step=args.save_step,
-        restore_path=args.restore_path  # Added
+        restore_path=args.restore_path,  # Added
+        persistent_workers=args.persistent_workers,
+        num_workers=args.num_workers,
+        mixed_precision=args.mixed_precision,
+        strict=args.strict,
+        pretokenize=args.pretokenize,
+        compile_gpt=args.compile,
+        compile_mode=args.compile_mode,
+        length_sampler=args.length_sampler,
+        tf32=args.tf32,
+        cudnn_benchmark=args.cudnn_benchmark,
+        deterministic=args.deterministic,
+        cuda_prefetch=args.cuda_prefetch,
+        optimizer=args.optimizer,
+        grad_checkpointing=args.grad_checkpointing,
     )
 
     print(f"Checkpoint saved in dir: {trainer_out_path}")